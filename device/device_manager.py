@@ -5,19 +5,50 @@ This module manages hardware devices in the operating system.
 It provides an interface for device registration, discovery, and control.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Callable, Tuple
 from utils.logger import Logger
 
 
+_logger = Logger(__name__)
+
+
 class Device:
     """Base class for all devices in the system."""
     
+    __slots__ = ('device_id', 'device_type', 'name', '_is_active', '_manager', 'properties')
+    
     def __init__(self, device_id: str, device_type: str, name: str):
         self.device_id = device_id
         self.device_type = device_type
         self.name = name
-        self.is_active = False
-        self.properties: Dict[str, Any] = {}
+        # Manager this device is registered with; told about every active-state change
+        self._manager: Optional['DeviceManager'] = None
+        self._is_active = False
+        # Allocated on first set_property; most devices never use it
+        self.properties: Optional[Dict[str, Any]] = None
+    
+    @property
+    def is_active(self) -> bool:
+        """Whether the device is active."""
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, value: bool):
+        if self._manager is not None and bool(value) != bool(self._is_active):
+            self._manager._active_count += 1 if value else -1
+        self._is_active = value
+    
+    def get_property(self, key: str, default: Any = None) -> Any:
+        """Get a device property."""
+        if self.properties is None:
+            return default
+        return self.properties.get(key, default)
+    
+    def set_property(self, key: str, value: Any):
+        """Set a device property."""
+        if self.properties is None:
+            self.properties = {}
+        self.properties[key] = value
     
     def initialize(self) -> bool:
         """Initialize the device."""
@@ -36,7 +67,7 @@ class Device:
             'device_type': self.device_type,
             'name': self.name,
             'is_active': self.is_active,
-            'properties': self.properties
+            'properties': self.properties or {}
         }
 
 
@@ -49,9 +80,11 @@ class DeviceManager:
     """
     
     def __init__(self):
-        self.logger = Logger(__name__)
+        self.logger = _logger
         self.devices: Dict[str, Device] = {}
-        self.device_types: Dict[str, List[str]] = {}
+        self.device_types: Dict[str, Set[str]] = {}
+        # Running count of active registered devices; Device.is_active keeps it in step
+        self._active_count = 0
         self.logger.info("Device Manager initialized")
     
     def initialize(self) -> bool:
@@ -65,27 +98,10 @@ class DeviceManager:
             self.logger.info("Initializing Device Manager...")
             
             # Register default devices
-            from .terminal import Terminal
-            from .keyboard import Keyboard
-            from .display import Display
-            
-            # Create and register terminal device
-            terminal = Terminal()
-            if not self.register_device(terminal):
-                self.logger.error("Failed to register terminal device")
-                return False
-            
-            # Create and register keyboard device
-            keyboard = Keyboard()
-            if not self.register_device(keyboard):
-                self.logger.error("Failed to register keyboard device")
-                return False
-            
-            # Create and register display device
-            display = Display()
-            if not self.register_device(display):
-                self.logger.error("Failed to register display device")
-                return False
+            for factory in DEFAULT_DEVICE_FACTORIES:
+                if not self.register_device(factory()):
+                    self.logger.error(f"Failed to register {factory.__name__} device")
+                    return False
             
             # Initialize all registered devices
             for device_id in list(self.devices.keys()):
@@ -115,11 +131,12 @@ class DeviceManager:
                 return False
             
             self.devices[device.device_id] = device
+            device._manager = self
+            if device.is_active:
+                self._active_count += 1
             
             # Add to device type registry
-            if device.device_type not in self.device_types:
-                self.device_types[device.device_type] = []
-            self.device_types[device.device_type].append(device.device_id)
+            self.device_types.setdefault(device.device_type, set()).add(device.device_id)
             
             self.logger.info(f"Device {device.device_id} ({device.name}) registered")
             return True
@@ -146,15 +163,18 @@ class DeviceManager:
             device = self.devices[device_id]
             
             # Remove from device type registry
-            if device.device_type in self.device_types:
-                if device_id in self.device_types[device.device_type]:
-                    self.device_types[device.device_type].remove(device_id)
+            type_ids = self.device_types.get(device.device_type)
+            if type_ids is not None:
+                type_ids.discard(device_id)
                 
                 # Remove empty device type
-                if not self.device_types[device.device_type]:
+                if not type_ids:
                     del self.device_types[device.device_type]
             
             del self.devices[device_id]
+            device._manager = None
+            if device.is_active:
+                self._active_count -= 1
             self.logger.info(f"Device {device_id} unregistered")
             return True
             
@@ -184,8 +204,9 @@ class DeviceManager:
         Returns:
             List[Device]: List of devices of the specified type
         """
-        device_ids = self.device_types.get(device_type, [])
-        return [self.devices[device_id] for device_id in device_ids if device_id in self.devices]
+        # register/unregister keep device_types in step with devices
+        devices = self.devices
+        return [devices[device_id] for device_id in self.device_types.get(device_type, ())]
     
     def get_all_devices(self) -> List[Device]:
         """
@@ -273,15 +294,16 @@ class DeviceManager:
         Returns:
             Dict: System-wide device status information
         """
+        total = len(self.devices)
         return {
-            'total_devices': len(self.devices),
+            'total_devices': total,
             'device_types': list(self.device_types.keys()),
             'devices_by_type': {
                 device_type: len(device_ids) 
                 for device_type, device_ids in self.device_types.items()
             },
-            'active_devices': len([d for d in self.devices.values() if d.is_active]),
-            'inactive_devices': len([d for d in self.devices.values() if not d.is_active])
+            'active_devices': self._active_count,
+            'inactive_devices': total - self._active_count
         }
     
     def discover_devices(self) -> List[str]:
@@ -310,4 +332,13 @@ class DeviceManager:
             if not self.shutdown_device(device_id):
                 success = False
         
-        return success 
\ No newline at end of file
+        return success
+
+
+# Default device classes subclass Device, so they are imported after it is defined
+from .terminal import Terminal
+from .keyboard import Keyboard
+from .display import Display
+
+# Devices registered by DeviceManager.initialize, in registration order
+DEFAULT_DEVICE_FACTORIES: Tuple[Callable[[], Device], ...] = (Terminal, Keyboard, Display)
@@ -5,24 +5,50 @@ This module provides display device functionality for the operating system.
 It handles screen output and display management.
 """
 
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 from .device_manager import Device
 from utils.logger import Logger
 
 
+_logger = Logger(__name__)
+
+
+# ANSI color names, indexed by their 4-bit color code
+COLOR_NAMES: Tuple[str, ...] = (
+    "black", "red", "green", "yellow", "blue", "magenta", "cyan", "white",
+    "bright_black", "bright_red", "bright_green", "bright_yellow",
+    "bright_blue", "bright_magenta", "bright_cyan", "bright_white"
+)
+COLOR_MAP = {name: code for code, name in enumerate(COLOR_NAMES)}
+
+
 class Display(Device):
     """Display device for handling screen output."""
     
+    __slots__ = (
+        'logger', 'width', 'height', 'screen_buffer', '_blank_line', '_dirty',
+        '_cached_view',
+        'cursor_x', 'cursor_y', 'foreground_color', 'background_color',
+        'is_cursor_visible'
+    )
+    
     def __init__(self, device_id: str = "display_0"):
         super().__init__(device_id, "display", "System Display")
-        self.logger = Logger(__name__)
+        self.logger = _logger
         self.width = 80  # Default terminal width
         self.height = 24  # Default terminal height
-        self.screen_buffer: List[List[str]] = []
+        # One blank row, reused to fill the buffer on clear and scroll
+        self._blank_line = b' ' * self.width
+        # Flat character buffer addressed as y * width + x, one Latin-1 byte per cell
+        self.screen_buffer = bytearray(self._blank_line * self.height)
+        # Line view returned by get_screen_content, rebuilt only after writes
+        self._dirty = True
+        self._cached_view: Optional[Tuple[str, ...]] = None
         self.cursor_x = 0
         self.cursor_y = 0
-        self.foreground_color = "white"
-        self.background_color = "black"
+        # Colors are stored as ANSI color codes (see COLOR_MAP)
+        self.foreground_color = COLOR_MAP["white"]
+        self.background_color = COLOR_MAP["black"]
         self.is_cursor_visible = True
         
     def initialize(self) -> bool:
@@ -48,12 +74,9 @@ class Display(Device):
     
     def _initialize_screen_buffer(self):
         """Initialize the screen buffer with empty characters."""
-        self.screen_buffer = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                row.append(' ')
-            self.screen_buffer.append(row)
+        self._blank_line = b' ' * self.width
+        self.screen_buffer = bytearray(self._blank_line * self.height)
+        self._dirty = True
     
     def set_resolution(self, width: int, height: int) -> bool:
         """
@@ -121,7 +144,10 @@ class Display(Device):
                 y = self.cursor_y
             
             if 0 <= x < self.width and 0 <= y < self.height:
-                self.screen_buffer[y][x] = char
+                code = ord(char)
+                # The buffer only holds Latin-1 characters; others are shown as '?'
+                self.screen_buffer[y * self.width + x] = code if code < 256 else 0x3F
+                self._dirty = True
                 self.cursor_x = x + 1
                 if self.cursor_x >= self.width:
                     self.cursor_x = 0
@@ -154,26 +180,54 @@ class Display(Device):
                 x = self.cursor_x
             if y is None:
                 y = self.cursor_y
+            # Work on locals and write the cursor back once at the end
+            w = self.width
+            h = self.height
             
+            # Lay the text out first, counting scrolls instead of performing
+            # them, so the buffer is shifted by a single slice copy at the end.
+            # Rows are recorded relative to the scroll count at write time.
+            fragments = []
+            scrolled = 0
             success = True
-            for i, char in enumerate(text):
-                if char == '\n':
+            for line_no, segment in enumerate(text.split('\n')):
+                if line_no:
                     x = 0
                     y += 1
-                    if y >= self.height:
-                        self._scroll_up()
-                        y = self.height - 1
-                else:
-                    if not self.write_char(char, x, y):
+                    if y >= h:
+                        scrolled += 1
+                        y = h - 1
+                
+                # Split the segment into row-sized slices
+                data = segment.encode('latin-1', 'replace')
+                while data:
+                    if not (0 <= x < w and 0 <= y < h):
                         success = False
                         break
-                    x += 1
-                    if x >= self.width:
+                    chunk = data[:w - x]
+                    size = len(chunk)
+                    fragments.append((y + scrolled, x, chunk))
+                    data = data[size:]
+                    x += size
+                    if x >= w:
                         x = 0
                         y += 1
-                        if y >= self.height:
-                            self._scroll_up()
-                            y = self.height - 1
+                        if y >= h:
+                            scrolled += 1
+                            y = h - 1
+                if not success:
+                    break
+            
+            if scrolled:
+                self._scroll_up(scrolled)
+            if fragments:
+                buf = self.screen_buffer
+                for row, col, chunk in fragments:
+                    row -= scrolled
+                    if row >= 0:
+                        start = row * w + col
+                        buf[start:start + len(chunk)] = chunk
+                self._dirty = True
             
             self.cursor_x = x
             self.cursor_y = y
@@ -182,13 +236,16 @@ class Display(Device):
             self.logger.error(f"Error writing string: {e}")
             return False
     
-    def _scroll_up(self):
-        """Scroll the screen up by one line."""
+    def _scroll_up(self, lines: int = 1):
+        """Scroll the screen up by the given number of lines."""
         try:
-            # Remove top line and add empty line at bottom
-            self.screen_buffer.pop(0)
-            new_line = [' ' for _ in range(self.width)]
-            self.screen_buffer.append(new_line)
+            # Shift the remaining lines up in one slice copy and blank the bottom
+            buf = self.screen_buffer
+            lines = min(lines, self.height)
+            count = lines * self.width
+            buf[:-count] = buf[count:]
+            buf[-count:] = self._blank_line if lines == 1 else self._blank_line * lines
+            self._dirty = True
         except Exception as e:
             self.logger.error(f"Error scrolling screen: {e}")
     
@@ -240,22 +297,34 @@ class Display(Device):
             background: Background color name
             
         Returns:
-            bool: True if colors set successfully, False otherwise
+            bool: True if colors set successfully, False if a color name is unknown
         """
+        fg = self.foreground_color
+        bg = self.background_color
         if foreground:
-            self.foreground_color = foreground
+            fg = COLOR_MAP.get(foreground)
         if background:
-            self.background_color = background
+            bg = COLOR_MAP.get(background)
+        if fg is None or bg is None:
+            return False
+        
+        self.foreground_color = fg
+        self.background_color = bg
         return True
     
-    def get_screen_content(self) -> List[List[str]]:
+    def get_screen_content(self) -> Tuple[str, ...]:
         """
         Get the current screen content.
         
         Returns:
-            List[List[str]]: Screen buffer content
+            Tuple[str, ...]: Screen buffer content, one string per line
         """
-        return [row[:] for row in self.screen_buffer]
+        if self._dirty or self._cached_view is None:
+            text = self.screen_buffer.decode('latin-1')
+            w = self.width
+            self._cached_view = tuple(text[i:i + w] for i in range(0, len(text), w))
+            self._dirty = False
+        return self._cached_view
     
     def refresh(self) -> bool:
         """
@@ -285,7 +354,7 @@ class Display(Device):
             'cursor_x': self.cursor_x,
             'cursor_y': self.cursor_y,
             'cursor_visible': self.is_cursor_visible,
-            'foreground_color': self.foreground_color,
-            'background_color': self.background_color
+            'foreground_color': COLOR_NAMES[self.foreground_color],
+            'background_color': COLOR_NAMES[self.background_color]
         })
         return status 
\ No newline at end of file
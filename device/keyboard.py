@@ -5,20 +5,31 @@ This module provides keyboard device functionality for the operating system.
 It handles keyboard input events and key processing.
 """
 
-from typing import Optional, List, Callable
+from collections import deque
+from typing import Optional, List, Callable, Deque, Tuple
 from .device_manager import Device
 from utils.logger import Logger
 
 
+_logger = Logger(__name__)
+
+
 class Keyboard(Device):
     """Keyboard device for handling key input events."""
     
+    __slots__ = (
+        'logger', 'max_buffer_size', 'key_buffer', 'key_handlers',
+        '_handlers_tuple', 'is_caps_lock', 'is_num_lock'
+    )
+    
     def __init__(self, device_id: str = "keyboard_0"):
         super().__init__(device_id, "keyboard", "System Keyboard")
-        self.logger = Logger(__name__)
-        self.key_buffer: List[str] = []
+        self.logger = _logger
         self.max_buffer_size = 100
+        self.key_buffer: Deque[str] = deque(maxlen=self.max_buffer_size)
         self.key_handlers: List[Callable[[str], None]] = []
+        # Immutable snapshot of key_handlers used for dispatch in write_key
+        self._handlers_tuple: Tuple[Callable[[str], None], ...] = ()
         self.is_caps_lock = False
         self.is_num_lock = True
         
@@ -53,13 +64,36 @@ class Keyboard(Device):
             return None
         
         try:
-            key = self.key_buffer.pop(0)
-            self.logger.debug(f"Read key: {key}")
+            key = self.key_buffer.popleft()
+            self.logger.debug("Read key: %s", key)
             return key
         except Exception as e:
             self.logger.error(f"Error reading key: {e}")
             return None
     
+    def read_keys(self, n: Optional[int] = None) -> str:
+        """
+        Read several keys from the keyboard buffer at once.
+        
+        Args:
+            n: Maximum number of keys to read (reads all buffered keys if None)
+            
+        Returns:
+            str: The keys read, in input order (empty if none available)
+        """
+        if not self.is_active or not self.key_buffer:
+            return ""
+        
+        buffer = self.key_buffer
+        if n is None or n >= len(buffer):
+            keys = "".join(buffer)
+            buffer.clear()
+        else:
+            popleft = buffer.popleft
+            keys = "".join([popleft() for _ in range(max(n, 0))])
+        self.logger.debug("Read %d keys", len(keys))
+        return keys
+    
     def write_key(self, key: str) -> bool:
         """
         Write a key to the keyboard buffer.
@@ -73,25 +107,23 @@ class Keyboard(Device):
         if not self.is_active:
             return False
         
-        try:
-            if len(self.key_buffer) < self.max_buffer_size:
-                self.key_buffer.append(key)
-                self.logger.debug(f"Added key to buffer: {key}")
-                
-                # Notify key handlers
-                for handler in self.key_handlers:
-                    try:
-                        handler(key)
-                    except Exception as e:
-                        self.logger.error(f"Error in key handler: {e}")
-                
-                return True
-            else:
-                self.logger.warning("Keyboard buffer full")
-                return False
-        except Exception as e:
-            self.logger.error(f"Error writing key: {e}")
+        key_buffer = self.key_buffer
+        # The deque carries its own bound; reject rather than drop the oldest key
+        if len(key_buffer) == key_buffer.maxlen:
+            self.logger.warning("Keyboard buffer full")
             return False
+        
+        key_buffer.append(key)
+        self.logger.debug("Added key to buffer: %s", key)
+        
+        # Notify key handlers
+        for handler in self._handlers_tuple:
+            try:
+                handler(key)
+            except Exception as e:
+                self.logger.error("Error in key handler: %s", e)
+        
+        return True
     
     def add_key_handler(self, handler: Callable[[str], None]) -> bool:
         """
@@ -103,13 +135,10 @@ class Keyboard(Device):
         Returns:
             bool: True if handler added successfully, False otherwise
         """
-        try:
-            self.key_handlers.append(handler)
-            self.logger.debug("Key handler added")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error adding key handler: {e}")
-            return False
+        self.key_handlers.append(handler)
+        self._handlers_tuple = tuple(self.key_handlers)
+        self.logger.debug("Key handler added")
+        return True
     
     def remove_key_handler(self, handler: Callable[[str], None]) -> bool:
         """
@@ -124,6 +153,7 @@ class Keyboard(Device):
         try:
             if handler in self.key_handlers:
                 self.key_handlers.remove(handler)
+                self._handlers_tuple = tuple(self.key_handlers)
                 self.logger.debug("Key handler removed")
                 return True
             return False
@@ -138,13 +168,9 @@ class Keyboard(Device):
         Returns:
             bool: True if clear successful, False otherwise
         """
-        try:
-            self.key_buffer.clear()
-            self.logger.debug("Keyboard buffer cleared")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error clearing keyboard buffer: {e}")
-            return False
+        self.key_buffer.clear()
+        self.logger.debug("Keyboard buffer cleared")
+        return True
     
     def get_buffer_size(self) -> int:
         """
@@ -162,13 +188,9 @@ class Keyboard(Device):
         Returns:
             bool: True if toggle successful, False otherwise
         """
-        try:
-            self.is_caps_lock = not self.is_caps_lock
-            self.logger.debug(f"Caps lock {'on' if self.is_caps_lock else 'off'}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error toggling caps lock: {e}")
-            return False
+        self.is_caps_lock = not self.is_caps_lock
+        self.logger.debug("Caps lock %s", 'on' if self.is_caps_lock else 'off')
+        return True
     
     def toggle_num_lock(self) -> bool:
         """
@@ -177,13 +199,9 @@ class Keyboard(Device):
         Returns:
             bool: True if toggle successful, False otherwise
         """
-        try:
-            self.is_num_lock = not self.is_num_lock
-            self.logger.debug(f"Num lock {'on' if self.is_num_lock else 'off'}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error toggling num lock: {e}")
-            return False
+        self.is_num_lock = not self.is_num_lock
+        self.logger.debug("Num lock %s", 'on' if self.is_num_lock else 'off')
+        return True
     
     def get_status(self) -> dict:
         """Get keyboard status information."""
@@ -5,21 +5,31 @@ This module provides terminal device functionality for the operating system.
 It handles input/output operations for the command line interface.
 """
 
-from typing import Optional, List
+import sys
+from collections import deque
+from typing import Optional, List, Deque
 from .device_manager import Device
 from utils.logger import Logger
 
 
+_logger = Logger(__name__)
+
+
 class Terminal(Device):
     """Terminal device for handling I/O operations."""
     
     def __init__(self, device_id: str = "terminal_0"):
         super().__init__(device_id, "terminal", "System Terminal")
-        self.logger = Logger(__name__)
+        self.logger = _logger
         self.input_buffer: List[str] = []
-        self.output_buffer: List[str] = []
+        # Most recent writes only, so long sessions do not grow without bound
+        self.output_buffer: Deque[str] = deque(maxlen=1024)
         self.cursor_position = 0
         self.is_interactive = True
+        # Pending output, written to stdout in one call by flush()
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self.flush_threshold = 8192
         
     def initialize(self) -> bool:
         """Initialize the terminal device."""
@@ -34,6 +44,7 @@ class Terminal(Device):
     def shutdown(self) -> bool:
         """Shutdown the terminal device."""
         try:
+            self.flush()
             self.is_active = False
             self.logger.info(f"Terminal {self.device_id} shutdown")
             return True
@@ -55,6 +66,8 @@ class Terminal(Device):
             # In a real implementation, this would read from stdin
             # For now, we'll use Python's input function
             if self.is_interactive:
+                # Make sure any prompt written so far is visible
+                self.flush()
                 return input()
             return None
         except Exception as e:
@@ -75,13 +88,39 @@ class Terminal(Device):
             return False
         
         try:
-            print(text, end='')
+            self._pending.append(text)
+            self._pending_size += len(text)
             self.output_buffer.append(text)
+            
+            # Line-buffered on a tty, block-buffered otherwise
+            if self._pending_size >= self.flush_threshold or ('\n' in text and sys.stdout.isatty()):
+                return self.flush()
             return True
         except Exception as e:
             self.logger.error(f"Error writing output: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write any pending output to stdout.
+        
+        Returns:
+            bool: True if flush successful, False otherwise
+        """
+        if not self._pending:
+            return True
+        
+        try:
+            text = ''.join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error flushing output: {e}")
+            return False
+    
     def write_line(self, text: str) -> bool:
         """
         Write a line to the terminal with newline.
@@ -105,8 +144,10 @@ class Terminal(Device):
             return False
         
         try:
-            # Clear screen by printing multiple newlines
-            print('\n' * 50)
+            # Clear the screen and home the cursor with ANSI escapes
+            self.flush()
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
             return True
         except Exception as e:
             self.logger.error(f"Error clearing screen: {e}")
@@ -2,30 +2,60 @@
 目录管理模块 - 实现目录结构管理
 """
 
+import bisect
+import functools
+import sys
 import time
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
-from .inode import Inode, FileType
+from .inode import Inode
+from utils.file_types import FileType, FILE_TYPE_NAMES
 from utils.logger import Logger
 
+@functools.lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """把绝对路径规范化为路径分量元组，处理 . 和 ..
+    
+    分量经过驻留，与目录项名称共享同一字符串对象。
+    """
+    # 快速路径：不含空分量、. 和 .. 的规范路径直接切分即可
+    if '//' not in path and '/.' not in path and not path.endswith('/'):
+        return tuple(map(sys.intern, path[1:].split('/'))) if path != '/' else ()
+    
+    result = []
+    append = result.append
+    for part in path.split('/'):
+        if not part or part == '.':
+            continue
+        elif part == '..':
+            if result:
+                result.pop()
+        else:
+            append(sys.intern(part))
+    return tuple(result)
+
 class DirectoryEntry:
     """目录项"""
     
-    def __init__(self, name: str, inode_number: int, entry_type: FileType = FileType.REGULAR):
-        self.name = name
+    __slots__ = ('name', 'inode_number', 'entry_type', 'entry_length', 'name_length', 'created_time')
+    
+    def __init__(self, name: str, inode_number: int, entry_type: FileType = FileType.REGULAR,
+                 created_time: Optional[float] = None):
+        # 驻留名称：重复的名称共享同一字符串，字典查找可走指针比较快速路径
+        self.name = sys.intern(name)
         self.inode_number = inode_number
         self.entry_type = entry_type
         self.entry_length = 0
         self.name_length = len(name)
-        self.created_time = time.time()
+        self.created_time = time.time() if created_time is None else created_time
     
     def get_info(self) -> Dict:
         """获取目录项信息"""
         return {
             'name': self.name,
             'inode_number': self.inode_number,
-            'entry_type': self.entry_type.value,
+            'entry_type': FILE_TYPE_NAMES[self.entry_type],
             'name_length': self.name_length,
             'created_time': self.created_time
         }
@@ -33,29 +63,46 @@ class DirectoryEntry:
 class Directory:
     """目录类"""
     
+    __slots__ = ('name', 'parent', 'path', '_path_prefix', 'entries', '_subdirs', '_files',
+                 '_sorted_names', '_sorted_view', 'inode', 'created_time', '_created_monotonic',
+                 'modified_time', 'accessed_time')
+    
+    logger = Logger()
+    
     def __init__(self, name: str, parent: Optional['Directory'] = None):
         """初始化目录"""
-        self.name = name
+        self.name = sys.intern(name)
         self.parent = parent
         self.path = self._build_path()
+        # 子项路径前缀，避免每次拼接日志路径时判断根目录
+        self._path_prefix = self.path if self.path.endswith('/') else self.path + '/'
         
         # 目录项
         self.entries: Dict[str, DirectoryEntry] = {}
+        # 按类型维护的子目录/文件名（dict 作有序集合，保持插入顺序）
+        self._subdirs: Dict[str, None] = {}
+        self._files: Dict[str, None] = {}
+        # 按名称排序的目录项名，增删时用二分维护，列目录时无需重新排序
+        self._sorted_names: List[str] = []
+        # _sorted_names 的只读快照，目录项变化时置为None
+        self._sorted_view: Optional[Tuple[str, ...]] = None
         
         # 目录inode
         self.inode = None  # 将在文件系统中设置
         
-        # 时间戳
+        # 时间戳：创建时间为墙上时间；修改/访问时间取单调时钟，
+        # 显示时通过 _wall_time 换算回墙上时间
+        now = time.monotonic()
         self.created_time = time.time()
-        self.modified_time = time.time()
-        self.accessed_time = time.time()
-        
-        self.logger = Logger()
+        self._created_monotonic = now
+        self.modified_time = now
+        self.accessed_time = now
         
         # 添加 . 和 .. 目录项
         if parent:
-            self.entries['.'] = DirectoryEntry('.', 0, FileType.DIRECTORY)
-            self.entries['..'] = DirectoryEntry('..', 0, FileType.DIRECTORY)
+            self.entries['.'] = DirectoryEntry('.', 0, FileType.DIRECTORY, self.created_time)
+            self.entries['..'] = DirectoryEntry('..', 0, FileType.DIRECTORY, self.created_time)
+            self._sorted_names = ['.', '..']
     
     def _build_path(self) -> str:
         """构建完整路径"""
@@ -74,11 +121,20 @@ class Directory:
             self.logger.warning(f"目录项已存在: {name}")
             return False
         
-        entry = DirectoryEntry(name, inode_number, entry_type)
+        now = time.monotonic()
+        # 目录项的创建时间对外是墙上时间，由同一次单调时钟读数换算得到
+        entry = DirectoryEntry(name, inode_number, entry_type, self._wall_time(now))
+        name = entry.name
         self.entries[name] = entry
-        self.modified_time = time.time()
-        
-        self.logger.log_file_event(f"添加目录项: {self.path}/{name} -> inode {inode_number}")
+        bisect.insort(self._sorted_names, name)
+        self._sorted_view = None
+        if entry_type is FileType.DIRECTORY:
+            self._subdirs[name] = None
+        elif entry_type is FileType.REGULAR:
+            self._files[name] = None
+        self.modified_time = now
+        
+        self.logger.log_file_event("添加目录项: %s%s -> inode %s", self._path_prefix, name, inode_number)
         return True
     
     def remove_entry(self, name: str) -> bool:
@@ -92,9 +148,13 @@ class Directory:
             return False
         
         del self.entries[name]
-        self.modified_time = time.time()
+        del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
+        self._sorted_view = None
+        self._subdirs.pop(name, None)
+        self._files.pop(name, None)
+        self.modified_time = time.monotonic()
         
-        self.logger.log_file_event(f"移除目录项: {self.path}/{name}")
+        self.logger.log_file_event("移除目录项: %s%s", self._path_prefix, name)
         return True
     
     def get_entry(self, name: str) -> Optional[DirectoryEntry]:
@@ -113,21 +173,19 @@ class Directory:
         """获取所有目录项名称"""
         return list(self.entries.keys())
     
+    def get_sorted_entry_names(self) -> Tuple[str, ...]:
+        """获取按名称排序的目录项名称（目录未变化时返回同一个元组）"""
+        if self._sorted_view is None:
+            self._sorted_view = tuple(self._sorted_names)
+        return self._sorted_view
+    
     def get_subdirectories(self) -> List[str]:
         """获取子目录名称"""
-        subdirs = []
-        for name, entry in self.entries.items():
-            if entry.entry_type == FileType.DIRECTORY and name not in ['.', '..']:
-                subdirs.append(name)
-        return subdirs
+        return list(self._subdirs)
     
     def get_files(self) -> List[str]:
         """获取文件名称"""
-        files = []
-        for name, entry in self.entries.items():
-            if entry.entry_type == FileType.REGULAR:
-                files.append(name)
-        return files
+        return list(self._files)
     
     def get_entry_count(self) -> int:
         """获取目录项数量"""
@@ -135,7 +193,8 @@ class Directory:
     
     def is_empty(self) -> bool:
         """检查目录是否为空"""
-        return len(self.entries) <= 2  # 只有 . 和 ..
+        # 非根目录总有 . 和 .. 两项，根目录没有
+        return len(self.entries) == (2 if self.parent else 0)
     
     def get_size(self) -> int:
         """获取目录大小"""
@@ -143,11 +202,15 @@ class Directory:
     
     def update_access_time(self):
         """更新访问时间"""
-        self.accessed_time = time.time()
+        self.accessed_time = time.monotonic()
     
     def update_modification_time(self):
         """更新修改时间"""
-        self.modified_time = time.time()
+        self.modified_time = time.monotonic()
+    
+    def _wall_time(self, monotonic_time: float) -> float:
+        """把单调时钟时间戳换算为墙上时间"""
+        return self.created_time + (monotonic_time - self._created_monotonic)
     
     def get_info(self) -> Dict:
         """获取目录信息"""
@@ -160,44 +223,52 @@ class Directory:
             'files': self.get_files(),
             'size': self.get_size(),
             'created_time': self.created_time,
-            'modified_time': self.modified_time,
-            'accessed_time': self.accessed_time,
+            'modified_time': self._wall_time(self.modified_time),
+            'accessed_time': self._wall_time(self.accessed_time),
             'is_empty': self.is_empty()
         }
     
     def print_info(self):
         """打印目录信息"""
-        info = self.get_info()
-        print(f"\n目录信息: {info['path']}")
-        print("-" * 50)
-        print(f"名称: {info['name']}")
-        print(f"路径: {info['path']}")
-        print(f"父目录: {info['parent']}")
-        print(f"目录项数: {info['entry_count']}")
-        print(f"子目录: {info['subdirectories']}")
-        print(f"文件: {info['files']}")
-        print(f"大小: {info['size']} bytes")
-        print(f"是否为空: {info['is_empty']}")
-        print(f"创建时间: {time.ctime(info['created_time'])}")
-        print(f"修改时间: {time.ctime(info['modified_time'])}")
-        print(f"访问时间: {time.ctime(info['accessed_time'])}")
+        # 直接读取属性，不经由 get_info 构建字典；所有行拼接后一次写出
+        lines = [
+            f"\n目录信息: {self.path}",
+            "-" * 50,
+            f"名称: {self.name}",
+            f"路径: {self.path}",
+            f"父目录: {self.parent.name if self.parent else None}",
+            f"目录项数: {len(self.entries)}",
+            f"子目录: {list(self._subdirs)}",
+            f"文件: {list(self._files)}",
+            f"大小: {self.get_size()} bytes",
+            f"是否为空: {self.is_empty()}",
+            f"创建时间: {time.ctime(self.created_time)}",
+            f"修改时间: {time.ctime(self._wall_time(self.modified_time))}",
+            f"访问时间: {time.ctime(self._wall_time(self.accessed_time))}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_contents(self, show_hidden: bool = False):
         """打印目录内容"""
-        print(f"\n目录内容: {self.path}")
-        print("-" * 60)
-        print(f"{'类型':<8} {'名称':<20} {'Inode':<8} {'大小':<10}")
-        print("-" * 60)
-        
-        for name, entry in sorted(self.entries.items()):
+        lines = [
+            f"\n目录内容: {self.path}",
+            "-" * 60,
+            f"{'类型':<8} {'名称':<20} {'Inode':<8} {'大小':<10}",
+            "-" * 60,
+        ]
+        
+        entries = self.entries
+        for name in self._sorted_names:
             if not show_hidden and name.startswith('.'):
                 continue
             
-            entry_type = entry.entry_type.value[:7]
-            print(f"{entry_type:<8} {name:<20} {entry.inode_number:<8} {'N/A':<10}")
+            entry = entries[name]
+            entry_type = FILE_TYPE_NAMES[entry.entry_type][:7]
+            lines.append(f"{entry_type:<8} {name:<20} {entry.inode_number:<8} {'N/A':<10}")
         
-        print("-" * 60)
-        print(f"总计: {len(self.entries)} 项")
+        lines.append("-" * 60)
+        lines.append(f"总计: {len(self.entries)} 项")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 class DirectoryTree:
     """目录树"""
@@ -206,6 +277,9 @@ class DirectoryTree:
         """初始化目录树"""
         self.root = Directory("/")
         self.current_directory = self.root
+        # 路径分量元组到目录对象的索引，查找目录只需一次字典查询，
+        # 父目录的键就是去掉最后一个分量的元组，无需重新拼接路径字符串
+        self._directories: Dict[Tuple[str, ...], Directory] = {(): self.root}
         self.logger = Logger()
     
     def create_directory(self, path: str) -> Optional[Directory]:
@@ -222,19 +296,19 @@ class DirectoryTree:
             return None
         
         dir_name = parts[-1]
-        if parent.has_entry(dir_name):
-            self.logger.warning(f"目录已存在: {path}")
+        # add_entry 自身会检查重名并记录警告，无需先 has_entry 再探测一次
+        if not parent.add_entry(dir_name, 0, FileType.DIRECTORY):  # inode号将在文件系统中设置
             return None
         
         # 创建新目录
         new_dir = Directory(dir_name, parent)
-        parent.add_entry(dir_name, 0, FileType.DIRECTORY)  # inode号将在文件系统中设置
+        self._directories[parts] = new_dir
         
-        self.logger.log_file_event(f"创建目录: {path}")
+        self.logger.log_file_event("创建目录: %s", path)
         return new_dir
     
-    def remove_directory(self, path: str) -> bool:
-        """删除目录"""
+    def remove_directory(self, path: str, recursive: bool = False) -> bool:
+        """删除目录，recursive 为 True 时连同其下的所有内容一起删除"""
         # 解析路径
         parts = self._parse_path(path)
         if not parts:
@@ -247,14 +321,17 @@ class DirectoryTree:
             return False
         
         if not directory.is_empty():
-            self.logger.error(f"目录不为空: {path}")
-            return False
+            if not recursive:
+                self.logger.error(f"目录不为空: {path}")
+                return False
+            self._purge_subtree(parts, directory)
         
         # 从父目录移除
         parent = directory.parent
         if parent:
             parent.remove_entry(directory.name)
-            self.logger.log_file_event(f"删除目录: {path}")
+            del self._directories[parts]
+            self.logger.log_file_event("删除目录: %s", path)
             return True
         
         return False
@@ -277,7 +354,7 @@ class DirectoryTree:
             return False
         
         self.current_directory = directory
-        self.logger.log_file_event(f"切换目录: {path}")
+        self.logger.log_file_event("切换目录: %s", path)
         return True
     
     def get_current_path(self) -> str:
@@ -298,52 +375,36 @@ class DirectoryTree:
         
         return directory.list_entries()
     
-    def _parse_path(self, path: str) -> List[str]:
+    def _parse_path(self, path: str) -> Tuple[str, ...]:
         """解析路径"""
         if not path:
-            return []
-        
-        # 处理绝对路径和相对路径
-        if path.startswith('/'):
-            parts = path.split('/')[1:]  # 移除开头的空字符串
-        else:
-            # 相对路径，从当前目录开始
-            current_parts = self.current_directory.path.split('/')[1:]
-            relative_parts = path.split('/')
-            parts = current_parts + relative_parts
+            return ()
         
-        # 处理 . 和 ..
-        result = []
-        for part in parts:
-            if part == '.':
-                continue
-            elif part == '..':
-                if result:
-                    result.pop()
-            elif part:
-                result.append(part)
-        
-        return result
+        # 相对路径拼接到当前目录之后，统一按绝对路径解析
+        if not path.startswith('/'):
+            path = self.current_directory._path_prefix + path
+        return _split_path(path)
+    
+    def _purge_subtree(self, parts: Tuple[str, ...], directory: Directory):
+        """从目录索引中移除 directory 下的所有子目录（不含其本身）
+        
+        一次栈遍历完成，子目录的键由父目录的键加上名字得到。
+        """
+        directories = self._directories
+        stack = [(parts, directory)]
+        while stack:
+            key, current = stack.pop()
+            for name in current._subdirs:
+                child_key = key + (name,)
+                child = directories.pop(child_key, None)
+                if child is not None:
+                    stack.append((child_key, child))
     
-    def _find_directory(self, parts: List[str]) -> Optional[Directory]:
+    def _find_directory(self, parts: Tuple[str, ...]) -> Optional[Directory]:
         """根据路径部分查找目录"""
-        current = self.root
-        
-        for part in parts:
-            if not current.has_entry(part):
-                return None
-            
-            entry = current.get_entry(part)
-            if entry.entry_type != FileType.DIRECTORY:
-                return None
-            
-            # 这里需要从文件系统获取实际的目录对象
-            # 临时实现：返回None
-            return None
-        
-        return current
+        return self._directories.get(parts)
     
-    def _find_parent_directory(self, parts: List[str]) -> Optional[Directory]:
+    def _find_parent_directory(self, parts: Tuple[str, ...]) -> Optional[Directory]:
         """查找父目录"""
         if not parts:
             return self.root
@@ -351,26 +412,40 @@ class DirectoryTree:
         return self._find_directory(parts)
     
     def print_tree(self, directory: Directory = None, prefix: str = "", max_depth: int = 3, current_depth: int = 0):
-        """打印目录树"""
+        """打印目录树
+        
+        用显式栈代替递归遍历子目录，所有行拼接后一次写出。
+        """
         if directory is None:
             directory = self.root
         
         if current_depth >= max_depth:
             return
         
-        entries = directory.list_entries()
-        for i, entry in enumerate(entries):
-            if entry.name in ['.', '..']:
+        lines = []
+        # 栈中每一层：目录的路径分量、目录对象、剩余目录项名的迭代器、最后一项的名称、行前缀、深度
+        names = directory.get_entry_names()
+        stack = [(_split_path(directory.path), directory, iter(names), names[-1] if names else None,
+                  prefix, current_depth)]
+        while stack:
+            key, current, remaining, last_name, prefix, depth = stack[-1]
+            name = next(remaining, None)
+            if name is None:
+                stack.pop()
+                continue
+            if name == '.' or name == '..':
                 continue
             
-            is_last = i == len(entries) - 1
-            current_prefix = prefix + ("└── " if is_last else "├── ")
-            
-            print(f"{current_prefix}{entry.name}")
+            is_last = name == last_name
+            lines.append(f"{prefix}{'└── ' if is_last else '├── '}{name}")
             
-            if entry.entry_type == FileType.DIRECTORY:
-                # 递归打印子目录
-                next_prefix = prefix + ("    " if is_last else "│   ")
-                # 这里需要获取实际的子目录对象
-                # 临时实现：跳过子目录
-                pass 
\ No newline at end of file
+            if current.entries[name].entry_type is FileType.DIRECTORY and depth + 1 < max_depth:
+                child_key = key + (name,)
+                child = self._directories.get(child_key)
+                if child is not None:
+                    names = child.get_entry_names()
+                    stack.append((child_key, child, iter(names), names[-1],
+                                  prefix + ("    " if is_last else "│   "), depth + 1))
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
@@ -2,12 +2,14 @@
 文件操作模块 - 实现基本的文件操作
 """
 
+import heapq
 import threading
 import time
-from typing import Dict, List, Optional, Tuple, BinaryIO
+from typing import List, Optional, Tuple, BinaryIO
 from enum import Enum
 
-from .inode import Inode, FileType
+from .inode import Inode
+from utils.file_types import FileType
 from utils.logger import Logger
 
 class OpenMode(Enum):
@@ -19,18 +21,46 @@ class OpenMode(Enum):
     WRITE_READ = "w+"
     APPEND_READ = "a+"
 
+# 模式字符串到打开模式的映射
+MODE_MAP = {mode.value: mode for mode in OpenMode}
+
+# 打开模式对应的权限位
+PERM_READ = 1
+PERM_WRITE = 2
+PERM_APPEND = 4
+
+MODE_PERMS = {
+    OpenMode.READ: PERM_READ,
+    OpenMode.WRITE: PERM_WRITE,
+    OpenMode.APPEND: PERM_WRITE | PERM_APPEND,
+    OpenMode.READ_WRITE: PERM_READ | PERM_WRITE,
+    OpenMode.WRITE_READ: PERM_READ | PERM_WRITE,
+    OpenMode.APPEND_READ: PERM_READ | PERM_WRITE | PERM_APPEND
+}
+
+# 要求文件已存在的打开模式
+MUST_EXIST_MODES = frozenset((OpenMode.READ, OpenMode.READ_WRITE, OpenMode.APPEND_READ))
+
 class FileDescriptor:
     """文件描述符"""
     
+    __slots__ = ('fd', 'file_path', 'mode', 'perms', 'position', 'inode',
+                 'opened_time', 'last_access_time', 'is_open', 'lock')
+    
     def __init__(self, fd: int, file_path: str, mode: OpenMode):
         self.fd = fd
         self.file_path = file_path
         self.mode = mode
+        self.perms = MODE_PERMS[mode]
         self.position = 0  # 文件指针位置
         self.inode = None
-        self.opened_time = time.time()
-        self.last_access_time = time.time()
+        # 单调时钟时间戳，仅用于先后比较
+        now = time.monotonic()
+        self.opened_time = now
+        self.last_access_time = now
         self.is_open = True
+        # 保护 position/inode 等可变状态
+        self.lock = threading.Lock()
 
 class FileOperations:
     """文件操作类"""
@@ -38,9 +68,13 @@ class FileOperations:
     def __init__(self):
         """初始化文件操作"""
         self.logger = Logger()
-        self.open_files: Dict[int, FileDescriptor] = {}
-        self.next_fd = 1
-        self.lock = threading.Lock()
+        # 描述符表：下标即描述符编号，0号保留不用，空槽为None
+        self.fd_table: List[Optional[FileDescriptor]] = [None]
+        # 已释放描述符的最小堆，与POSIX一致总是复用最小的可用编号
+        self.free_fds: List[int] = []
+        self.open_count = 0
+        # 保护描述符表结构（打开/关闭），单个描述符的读写由其自身的锁保护
+        self.lock = threading.RLock()
         
         # 文件系统引用
         self.file_system = None
@@ -63,24 +97,28 @@ class FileOperations:
                     return -1
                 
                 # 检查文件是否存在
-                if open_mode in [OpenMode.READ, OpenMode.READ_WRITE, OpenMode.APPEND_READ]:
+                if open_mode in MUST_EXIST_MODES:
                     if not self._file_exists(path):
                         self.logger.error(f"文件不存在: {path}")
                         return -1
                 
                 # 创建文件描述符
-                fd = self.next_fd
-                self.next_fd += 1
+                if self.free_fds:
+                    fd = heapq.heappop(self.free_fds)
+                else:
+                    fd = len(self.fd_table)
+                    self.fd_table.append(None)
                 
                 file_descriptor = FileDescriptor(fd, path, open_mode)
-                self.open_files[fd] = file_descriptor
+                self.fd_table[fd] = file_descriptor
+                self.open_count += 1
                 
                 # 获取或创建inode
                 inode = self._get_or_create_inode(path, open_mode)
                 if inode:
                     file_descriptor.inode = inode
                 
-                self.logger.log_file_event(f"打开文件: {path}, 模式: {mode}, 描述符: {fd}")
+                self.logger.log_file_event("打开文件: %s, 模式: %s, 描述符: %s", path, mode, fd)
                 return fd
                 
             except Exception as e:
@@ -90,37 +128,42 @@ class FileOperations:
     def close_file(self, fd: int) -> bool:
         """关闭文件"""
         with self.lock:
-            if fd not in self.open_files:
+            file_descriptor = self._lookup(fd)
+            if file_descriptor is None:
                 self.logger.warning(f"文件描述符不存在: {fd}")
                 return False
             
-            file_descriptor = self.open_files[fd]
-            file_descriptor.is_open = False
-            
-            # 更新inode访问时间
-            if file_descriptor.inode:
-                file_descriptor.inode.update_access_time()
+            with file_descriptor.lock:
+                file_descriptor.is_open = False
+                
+                # 更新inode访问时间
+                if file_descriptor.inode:
+                    file_descriptor.inode.update_access_time()
             
-            del self.open_files[fd]
+            self.fd_table[fd] = None
+            heapq.heappush(self.free_fds, fd)
+            self.open_count -= 1
             
-            self.logger.log_file_event(f"关闭文件: 描述符 {fd}")
+            self.logger.log_file_event("关闭文件: 描述符 %s", fd)
             return True
     
-    def read_file(self, fd: int, size: int) -> str:
+    def read_file(self, fd: int, size: int) -> bytes:
         """读取文件"""
         with self.lock:
-            if fd not in self.open_files:
-                self.logger.error(f"文件描述符不存在: {fd}")
-                return ""
-            
-            file_descriptor = self.open_files[fd]
+            file_descriptor = self._lookup(fd)
+        if file_descriptor is None:
+            self.logger.error(f"文件描述符不存在: {fd}")
+            return b""
+        
+        # 只持有该描述符自己的锁，不同描述符上的I/O可以并行
+        with file_descriptor.lock:
             if not file_descriptor.is_open:
                 self.logger.error(f"文件描述符已关闭: {fd}")
-                return ""
+                return b""
             
-            if file_descriptor.mode not in [OpenMode.READ, OpenMode.READ_WRITE, OpenMode.APPEND_READ]:
+            if not file_descriptor.perms & PERM_READ:
                 self.logger.error(f"文件未以读模式打开: {fd}")
-                return ""
+                return b""
             
             # TODO: 实现文件读取
             # 1. 检查文件指针位置
@@ -131,25 +174,27 @@ class FileOperations:
             content = self._read_from_inode(file_descriptor.inode, file_descriptor.position, size)
             if content:
                 file_descriptor.position += len(content)
-                file_descriptor.last_access_time = time.time()
-                file_descriptor.inode.update_access_time()
+                file_descriptor.last_access_time = time.monotonic()
+                if file_descriptor.inode:
+                    file_descriptor.inode.update_access_time()
             
-            self.logger.log_file_event(f"读取文件: 描述符 {fd}, 大小 {size}, 实际读取 {len(content)}")
+            self.logger.log_file_event("读取文件: 描述符 %s, 大小 %s, 实际读取 %s", fd, size, len(content))
             return content
     
-    def write_file(self, fd: int, data: str) -> int:
+    def write_file(self, fd: int, data: bytes) -> int:
         """写入文件"""
         with self.lock:
-            if fd not in self.open_files:
-                self.logger.error(f"文件描述符不存在: {fd}")
-                return -1
-            
-            file_descriptor = self.open_files[fd]
+            file_descriptor = self._lookup(fd)
+        if file_descriptor is None:
+            self.logger.error(f"文件描述符不存在: {fd}")
+            return -1
+        
+        with file_descriptor.lock:
             if not file_descriptor.is_open:
                 self.logger.error(f"文件描述符已关闭: {fd}")
                 return -1
             
-            if file_descriptor.mode not in [OpenMode.WRITE, OpenMode.APPEND, OpenMode.READ_WRITE, OpenMode.WRITE_READ, OpenMode.APPEND_READ]:
+            if not file_descriptor.perms & PERM_WRITE:
                 self.logger.error(f"文件未以写模式打开: {fd}")
                 return -1
             
@@ -163,20 +208,31 @@ class FileOperations:
             written_size = self._write_to_inode(file_descriptor.inode, file_descriptor.position, data)
             if written_size > 0:
                 file_descriptor.position += written_size
-                file_descriptor.last_access_time = time.time()
-                file_descriptor.inode.update_modification_time()
+                file_descriptor.last_access_time = time.monotonic()
+                if file_descriptor.inode:
+                    file_descriptor.inode.update_modification_time()
             
-            self.logger.log_file_event(f"写入文件: 描述符 {fd}, 数据长度 {len(data)}, 实际写入 {written_size}")
+            self.logger.log_file_event("写入文件: 描述符 %s, 数据长度 %s, 实际写入 %s", fd, len(data), written_size)
             return written_size
     
+    def writev(self, fd: int, buffers: List[bytes]) -> int:
+        """批量写入文件（类似POSIX writev）
+        
+        多段数据合并为一次提交：只查找、加锁和写入inode一次。
+        """
+        if not buffers:
+            return 0
+        return self.write_file(fd, b"".join(buffers))
+    
     def seek_file(self, fd: int, offset: int, whence: int = 0) -> int:
         """文件指针定位"""
         with self.lock:
-            if fd not in self.open_files:
-                self.logger.error(f"文件描述符不存在: {fd}")
-                return -1
-            
-            file_descriptor = self.open_files[fd]
+            file_descriptor = self._lookup(fd)
+        if file_descriptor is None:
+            self.logger.error(f"文件描述符不存在: {fd}")
+            return -1
+        
+        with file_descriptor.lock:
             if not file_descriptor.is_open:
                 self.logger.error(f"文件描述符已关闭: {fd}")
                 return -1
@@ -197,17 +253,18 @@ class FileOperations:
                 new_position = 0
             
             file_descriptor.position = new_position
-            self.logger.log_file_event(f"文件指针定位: 描述符 {fd}, 位置 {new_position}")
+            self.logger.log_file_event("文件指针定位: 描述符 %s, 位置 %s", fd, new_position)
             return new_position
     
     def truncate_file(self, fd: int, size: int) -> bool:
         """截断文件"""
         with self.lock:
-            if fd not in self.open_files:
-                self.logger.error(f"文件描述符不存在: {fd}")
-                return False
-            
-            file_descriptor = self.open_files[fd]
+            file_descriptor = self._lookup(fd)
+        if file_descriptor is None:
+            self.logger.error(f"文件描述符不存在: {fd}")
+            return False
+        
+        with file_descriptor.lock:
             if not file_descriptor.is_open:
                 self.logger.error(f"文件描述符已关闭: {fd}")
                 return False
@@ -225,20 +282,18 @@ class FileOperations:
             file_descriptor.inode.set_size(size)
             file_descriptor.inode.update_modification_time()
             
-            self.logger.log_file_event(f"截断文件: 描述符 {fd}, 大小 {old_size} -> {size}")
+            self.logger.log_file_event("截断文件: 描述符 %s, 大小 %s -> %s", fd, old_size, size)
             return True
     
+    def _lookup(self, fd: int) -> Optional[FileDescriptor]:
+        """按编号查找描述符（调用方需持有锁）"""
+        if 0 < fd < len(self.fd_table):
+            return self.fd_table[fd]
+        return None
+    
     def _parse_mode(self, mode: str) -> Optional[OpenMode]:
         """解析文件打开模式"""
-        mode_map = {
-            'r': OpenMode.READ,
-            'w': OpenMode.WRITE,
-            'a': OpenMode.APPEND,
-            'r+': OpenMode.READ_WRITE,
-            'w+': OpenMode.WRITE_READ,
-            'a+': OpenMode.APPEND_READ
-        }
-        return mode_map.get(mode)
+        return MODE_MAP.get(mode)
     
     def _file_exists(self, path: str) -> bool:
         """检查文件是否存在"""
@@ -256,15 +311,15 @@ class FileOperations:
         # 3. 返回inode
         return None  # 临时实现
     
-    def _read_from_inode(self, inode: Inode, position: int, size: int) -> str:
+    def _read_from_inode(self, inode: Inode, position: int, size: int) -> bytes:
         """从inode读取数据"""
         # TODO: 实现从inode读取数据
         # 1. 计算数据块位置
         # 2. 读取数据块
         # 3. 返回数据
-        return ""  # 临时实现
+        return b""  # 临时实现
     
-    def _write_to_inode(self, inode: Inode, position: int, data: str) -> int:
+    def _write_to_inode(self, inode: Inode, position: int, data: bytes) -> int:
         """向inode写入数据"""
         # TODO: 实现向inode写入数据
         # 1. 计算数据块位置
@@ -276,22 +331,25 @@ class FileOperations:
     def get_open_files(self) -> List[FileDescriptor]:
         """获取所有打开的文件"""
         with self.lock:
-            return list(self.open_files.values())
+            return [file_desc for file_desc in self.fd_table if file_desc is not None]
     
     def get_file_descriptor(self, fd: int) -> Optional[FileDescriptor]:
         """获取文件描述符"""
         with self.lock:
-            return self.open_files.get(fd)
+            return self._lookup(fd)
     
     def print_open_files(self):
         """打印打开的文件"""
         with self.lock:
-            print(f"\n打开的文件 (共 {len(self.open_files)} 个):")
+            print(f"\n打开的文件 (共 {self.open_count} 个):")
             print("-" * 80)
             print(f"{'描述符':<8} {'路径':<30} {'模式':<8} {'位置':<8} {'大小':<8}")
             print("-" * 80)
             
-            for fd, file_desc in self.open_files.items():
+            for file_desc in self.fd_table:
+                if file_desc is None:
+                    continue
+                fd = file_desc.fd
                 size = file_desc.inode.get_size() if file_desc.inode else 0
                 print(f"{fd:<8} {file_desc.file_path:<30} {file_desc.mode.value:<8} "
                       f"{file_desc.position:<8} {size:<8}")
@@ -301,7 +359,16 @@ class FileOperations:
     def cleanup(self):
         """清理文件操作"""
         with self.lock:
-            # 关闭所有打开的文件
-            for fd in list(self.open_files.keys()):
-                self.close_file(fd)
+            # 一次性关闭所有打开的文件，不逐个调用close_file
+            for file_desc in self.fd_table:
+                if file_desc is None:
+                    continue
+                with file_desc.lock:
+                    file_desc.is_open = False
+                    if file_desc.inode:
+                        file_desc.inode.update_access_time()
+            
+            self.fd_table = [None]
+            self.free_fds = []
+            self.open_count = 0
             self.logger.info("文件操作清理完成") 
\ No newline at end of file
@@ -2,18 +2,36 @@
 文件系统核心模块 - 实现基本的文件系统功能
 """
 
+import functools
+import itertools
 import threading
-import time
+import weakref
+from array import array
 from typing import Dict, List, Optional, Tuple
-from enum import Enum
 
+from utils.clock import coarse_time
+from utils.file_types import FileType
 from utils.logger import Logger
 
-class FileType(Enum):
-    """文件类型枚举"""
-    REGULAR = "regular"
-    DIRECTORY = "directory"
-    SYMBOLIC_LINK = "symlink"
+# 打开文件表的分片数（2的幂），描述符的低位即分片编号
+OPEN_FILE_SHARDS = 16
+_SHARD_MASK = OPEN_FILE_SHARDS - 1
+
+# 统计计数器在 _stats 数组中的下标
+STAT_TOTAL_FILES = 0
+STAT_TOTAL_DIRECTORIES = 1
+STAT_TOTAL_SIZE = 2
+
+@functools.lru_cache(maxsize=4096)
+def _parse_path_cached(path: str) -> Tuple[str, str]:
+    """分离目录路径和文件名（结果是不可变的元组，可以安全缓存）"""
+    # TODO: 处理相对路径
+    if path.endswith("/"):
+        return path, ""
+    parts = path.rsplit("/", 1)
+    if len(parts) == 1:
+        return ".", parts[0]
+    return parts[0] or "/", parts[1]
 
 class FileSystem:
     """文件系统核心"""
@@ -23,14 +41,20 @@ class FileSystem:
         self.logger = Logger()
         self.root_directory = None  # 将在Directory类中实现
         self.current_directory = None
-        self.open_files: Dict[int, 'File'] = {}
-        self.next_file_descriptor = 1
-        self.lock = threading.Lock()
+        # 打开文件表按描述符分片，每个分片有自己的锁和字典，
+        # 不同分片上的打开/关闭/读写互不竞争。
+        # 表中只保存弱引用，文件对象由打开它的一方持有，
+        # 未关闭就被丢弃的文件会自动从表中消失
+        self._shards: List[Tuple[threading.Lock, weakref.WeakValueDictionary]] = [
+            (threading.Lock(), weakref.WeakValueDictionary()) for _ in range(OPEN_FILE_SHARDS)
+        ]
+        # 每个分片独立发放描述符：分片 i 只发放低位等于 i 的编号（0号不用）
+        self._fd_counters = [i or OPEN_FILE_SHARDS for i in range(OPEN_FILE_SHARDS)]
+        # 轮流选择分片，让打开的文件均匀分布
+        self._next_shard = itertools.count(1)
         
-        # 文件系统统计
-        self.total_files = 0
-        self.total_directories = 0
-        self.total_size = 0
+        # 文件系统统计：由持有分片锁的写者更新，读者不加锁
+        self._stats = array('q', [0, 0, 0])
         
         self.logger.info("文件系统初始化")
     
@@ -48,7 +72,7 @@ class FileSystem:
         # 2. 检查父目录是否存在
         # 3. 创建文件
         # 4. 更新统计信息
-        self.logger.log_file_event(f"创建文件: {path}")
+        self.logger.log_file_event("创建文件: %s", path)
         return True
     
     def read_file(self, path: str) -> str:
@@ -57,7 +81,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 检查文件是否存在
         # 3. 读取文件内容
-        self.logger.log_file_event(f"读取文件: {path}")
+        self.logger.log_file_event("读取文件: %s", path)
         return ""
     
     def write_file(self, path: str, content: str) -> bool:
@@ -66,7 +90,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 检查文件是否存在
         # 3. 写入文件内容
-        self.logger.log_file_event(f"写入文件: {path}")
+        self.logger.log_file_event("写入文件: %s", path)
         return True
     
     def delete_file(self, path: str) -> bool:
@@ -76,7 +100,7 @@ class FileSystem:
         # 2. 检查文件是否存在
         # 3. 删除文件
         # 4. 更新统计信息
-        self.logger.log_file_event(f"删除文件: {path}")
+        self.logger.log_file_event("删除文件: %s", path)
         return True
     
     def create_directory(self, path: str) -> bool:
@@ -85,7 +109,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 检查父目录是否存在
         # 3. 创建目录
-        self.logger.log_file_event(f"创建目录: {path}")
+        self.logger.log_file_event("创建目录: %s", path)
         return True
     
     def delete_directory(self, path: str) -> bool:
@@ -94,7 +118,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 检查目录是否为空
         # 3. 删除目录
-        self.logger.log_file_event(f"删除目录: {path}")
+        self.logger.log_file_event("删除目录: %s", path)
         return True
     
     def list_directory(self, path: str = ".") -> List[str]:
@@ -103,7 +127,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 获取目录内容
         # 3. 返回文件列表
-        self.logger.log_file_event(f"列出目录: {path}")
+        self.logger.log_file_event("列出目录: %s", path)
         return []
     
     def change_directory(self, path: str) -> bool:
@@ -112,7 +136,7 @@ class FileSystem:
         # 1. 解析路径
         # 2. 检查目录是否存在
         # 3. 更新当前目录
-        self.logger.log_file_event(f"切换目录: {path}")
+        self.logger.log_file_event("切换目录: %s", path)
         return True
     
     def get_current_directory(self) -> str:
@@ -127,9 +151,12 @@ class FileSystem:
         # 2. 检查文件是否存在
         # 3. 创建文件描述符
         # 4. 返回文件描述符
-        fd = self.next_file_descriptor
-        self.next_file_descriptor += 1
-        self.logger.log_file_event(f"打开文件: {path}, 模式: {mode}, 描述符: {fd}")
+        shard_id = next(self._next_shard) & _SHARD_MASK
+        lock, files = self._shards[shard_id]
+        with lock:
+            fd = self._fd_counters[shard_id]
+            self._fd_counters[shard_id] = fd + OPEN_FILE_SHARDS
+        self.logger.log_file_event("打开文件: %s, 模式: %s, 描述符: %s", path, mode, fd)
         return fd
     
     def close_file(self, fd: int) -> bool:
@@ -138,9 +165,11 @@ class FileSystem:
         # 1. 检查文件描述符是否有效
         # 2. 关闭文件
         # 3. 释放资源
-        if fd in self.open_files:
-            del self.open_files[fd]
-            self.logger.log_file_event(f"关闭文件: 描述符 {fd}")
+        lock, files = self._shards[fd & _SHARD_MASK]
+        with lock:
+            closed = files.pop(fd, None) is not None
+        if closed:
+            self.logger.log_file_event("关闭文件: 描述符 %s", fd)
             return True
         return False
     
@@ -149,8 +178,8 @@ class FileSystem:
         # TODO: 实现文件描述符读取
         # 1. 检查文件描述符是否有效
         # 2. 读取指定大小的数据
-        if fd in self.open_files:
-            self.logger.log_file_event(f"通过描述符读取: {fd}, 大小: {size}")
+        if fd in self._shards[fd & _SHARD_MASK][1]:
+            self.logger.log_file_event("通过描述符读取: %s, 大小: %s", fd, size)
             return ""
         return ""
     
@@ -160,32 +189,24 @@ class FileSystem:
         # 1. 检查文件描述符是否有效
         # 2. 写入数据
         # 3. 返回写入的字节数
-        if fd in self.open_files:
-            self.logger.log_file_event(f"通过描述符写入: {fd}, 数据长度: {len(data)}")
+        if fd in self._shards[fd & _SHARD_MASK][1]:
+            self.logger.log_file_event("通过描述符写入: %s, 数据长度: %s", fd, len(data))
             return len(data)
         return 0
     
     def _parse_path(self, path: str) -> Tuple[str, str]:
         """解析路径，返回目录路径和文件名"""
-        # TODO: 实现路径解析
-        # 1. 处理绝对路径和相对路径
-        # 2. 分离目录路径和文件名
-        if path.endswith("/"):
-            return path, ""
-        else:
-            parts = path.rsplit("/", 1)
-            if len(parts) == 1:
-                return ".", parts[0]
-            else:
-                return parts[0] or "/", parts[1]
+        return _parse_path_cached(path)
     
     def get_file_system_stats(self) -> Dict[str, int]:
         """获取文件系统统计信息"""
+        total_files, total_directories, total_size = self._stats
         return {
-            'total_files': self.total_files,
-            'total_directories': self.total_directories,
-            'total_size': self.total_size,
-            'open_files': len(self.open_files)
+            'total_files': total_files,
+            'total_directories': total_directories,
+            'total_size': total_size,
+            # 不加锁汇总各分片，读到的是近似值
+            'open_files': sum(len(files) for _, files in self._shards)
         }
     
     def print_file_system_info(self):
@@ -200,21 +221,36 @@ class FileSystem:
     
     def cleanup(self):
         """清理文件系统"""
-        # 关闭所有打开的文件
-        for fd in list(self.open_files.keys()):
-            self.close_file(fd)
-        self.logger.info("文件系统清理完成")
+        # 子类重写了close_file时保留逐个关闭，让其附加处理生效
+        if type(self).close_file is not FileSystem.close_file:
+            for _, files in self._shards:
+                for fd in list(files):
+                    self.close_file(fd)
+        
+        # 关闭所有打开的文件：每个分片只加一次锁，整体换掉它的表
+        closed = 0
+        for index, (lock, files) in enumerate(self._shards):
+            with lock:
+                self._shards[index] = (lock, weakref.WeakValueDictionary())
+            closed += len(files)
+        
+        self.logger.info("文件系统清理完成，关闭了 %d 个打开的文件", closed)
 
 class File:
     """文件类"""
     
+    __slots__ = ('name', 'path', 'type', 'size', 'content',
+                 'created_time', 'modified_time', 'accessed_time', 'permissions',
+                 '__weakref__')
+    
     def __init__(self, name: str, path: str, file_type: FileType = FileType.REGULAR):
         self.name = name
         self.path = path
         self.type = file_type
         self.size = 0
         self.content = ""
-        self.created_time = time.time()
-        self.modified_time = time.time()
-        self.accessed_time = time.time()
+        now = coarse_time()
+        self.created_time = now
+        self.modified_time = now
+        self.accessed_time = now
         self.permissions = 0o644  # 默认权限 
\ No newline at end of file
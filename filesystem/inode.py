@@ -3,24 +3,38 @@
 """
 
 import time
+from array import array
 from typing import Dict, List, Optional
-from enum import Enum
 
+from utils.clock import coarse_time
+from utils.file_types import FileType, FILE_TYPE_NAMES
 from utils.logger import Logger
 
-class FileType(Enum):
-    """文件类型枚举"""
-    REGULAR = "regular"
-    DIRECTORY = "directory"
-    SYMBOLIC_LINK = "symlink"
-    FIFO = "fifo"
-    SOCKET = "socket"
+# 每个inode的直接块指针数量
+DIRECT_BLOCKS = 12
+DIRECT_BLOCKS_MASK = (1 << DIRECT_BLOCKS) - 1
+_EMPTY_DIRECT_BLOCKS = array('i', [-1] * DIRECT_BLOCKS)
 
 class Inode:
     """索引节点"""
     
+    __slots__ = ('inode_number', 'file_type', 'size', 'blocks', 'permissions',
+                 'created_time', 'modified_time', 'accessed_time', 'owner_id', 'group_id',
+                 'direct_blocks', 'single_indirect', 'double_indirect', 'triple_indirect',
+                 '_free_direct_mask', '_block_to_slot', 'link_count', 'fs_specific',
+                 '_info_cache')
+    
+    # 所有inode共享一个日志记录器，不占用实例槽位
+    logger = Logger()
+    
     def __init__(self, inode_number: int, file_type: FileType = FileType.REGULAR):
         """初始化索引节点"""
+        # 文件系统特定信息
+        self.fs_specific = {}
+        self.reset(inode_number, file_type)
+    
+    def reset(self, inode_number: int, file_type: FileType = FileType.REGULAR):
+        """将inode重置为新分配的状态，供inode池复用对象"""
         self.inode_number = inode_number
         self.file_type = file_type
         
@@ -30,16 +44,20 @@ class Inode:
         self.permissions = 0o644  # 默认权限
         
         # 时间戳
-        self.created_time = time.time()
-        self.modified_time = time.time()
-        self.accessed_time = time.time()
+        now = coarse_time()
+        self.created_time = now
+        self.modified_time = now
+        self.accessed_time = now
         
         # 所有者信息
         self.owner_id = 0
         self.group_id = 0
         
-        # 直接块指针 (前12个直接块)
-        self.direct_blocks: List[int] = [-1] * 12
+        # 直接块指针 (前12个直接块)，多数小文件用不到，首次添加块时才分配
+        self.direct_blocks: Optional[array] = None
+        # 空闲直接块槽位掩码（第 i 位置1表示槽位 i 空闲）及块号到槽位的反查表
+        self._free_direct_mask = DIRECT_BLOCKS_MASK
+        self._block_to_slot: Dict[int, int] = {}
         
         # 间接块指针
         self.single_indirect = -1
@@ -49,10 +67,10 @@ class Inode:
         # 链接计数
         self.link_count = 1
         
-        # 文件系统特定信息
-        self.fs_specific = {}
+        self.fs_specific.clear()
         
-        self.logger = Logger()
+        # get_info 的缓存结果，修改inode时置为None
+        self._info_cache: Optional[Dict] = None
     
     def get_size(self) -> int:
         """获取文件大小"""
@@ -61,8 +79,9 @@ class Inode:
     def set_size(self, size: int):
         """设置文件大小"""
         self.size = size
-        self.modified_time = time.time()
-        self.logger.log_file_event(f"更新inode {self.inode_number} 大小: {size}")
+        self.modified_time = coarse_time()
+        self._info_cache = None
+        self.logger.log_file_event("更新inode %s 大小: %s", self.inode_number, size)
     
     def get_blocks(self) -> int:
         """获取块数"""
@@ -71,36 +90,59 @@ class Inode:
     def set_blocks(self, blocks: int):
         """设置块数"""
         self.blocks = blocks
-        self.modified_time = time.time()
+        self.modified_time = coarse_time()
+        self._info_cache = None
     
     def add_direct_block(self, block_number: int) -> bool:
         """添加直接块"""
-        for i, block in enumerate(self.direct_blocks):
-            if block == -1:
-                self.direct_blocks[i] = block_number
-                self.blocks += 1
-                self.modified_time = time.time()
-                return True
-        return False
+        mask = self._free_direct_mask
+        # 同一个块不能占用两个槽位，否则反查表只能记住其中一个
+        if not mask or block_number in self._block_to_slot:
+            return False
+        
+        # 取最低的空闲位，即编号最小的空闲槽位
+        bit = mask & -mask
+        index = bit.bit_length() - 1
+        if self.direct_blocks is None:
+            self.direct_blocks = array('i', _EMPTY_DIRECT_BLOCKS)
+        self.direct_blocks[index] = block_number
+        self._free_direct_mask = mask & ~bit
+        self._block_to_slot[block_number] = index
+        self.blocks += 1
+        self.modified_time = coarse_time()
+        self._info_cache = None
+        return True
     
     def remove_direct_block(self, block_number: int) -> bool:
         """移除直接块"""
-        for i, block in enumerate(self.direct_blocks):
-            if block == block_number:
-                self.direct_blocks[i] = -1
-                self.blocks -= 1
-                self.modified_time = time.time()
-                return True
-        return False
+        index = self._block_to_slot.pop(block_number, None)
+        if index is None:
+            return False
+        
+        self.direct_blocks[index] = -1
+        self._free_direct_mask |= 1 << index
+        self.blocks -= 1
+        self.modified_time = coarse_time()
+        self._info_cache = None
+        return True
     
     def get_direct_blocks(self) -> List[int]:
         """获取所有直接块"""
-        return [block for block in self.direct_blocks if block != -1]
+        # 只遍历已占用槽位对应的位，循环次数等于已分配的块数
+        direct_blocks = self.direct_blocks
+        result = []
+        used = ~self._free_direct_mask & DIRECT_BLOCKS_MASK
+        while used:
+            bit = used & -used
+            result.append(direct_blocks[bit.bit_length() - 1])
+            used ^= bit
+        return result
     
     def set_permissions(self, permissions: int):
         """设置权限"""
         self.permissions = permissions
-        self.modified_time = time.time()
+        self.modified_time = coarse_time()
+        self._info_cache = None
     
     def get_permissions(self) -> int:
         """获取权限"""
@@ -108,22 +150,25 @@ class Inode:
     
     def update_access_time(self):
         """更新访问时间"""
-        self.accessed_time = time.time()
+        self.accessed_time = coarse_time()
     
     def update_modification_time(self):
         """更新修改时间"""
-        self.modified_time = time.time()
+        self.modified_time = coarse_time()
+        self._info_cache = None
     
     def increment_link_count(self):
         """增加链接计数"""
         self.link_count += 1
-        self.modified_time = time.time()
+        self.modified_time = coarse_time()
+        self._info_cache = None
     
     def decrement_link_count(self) -> int:
         """减少链接计数"""
         if self.link_count > 0:
             self.link_count -= 1
-            self.modified_time = time.time()
+            self.modified_time = coarse_time()
+            self._info_cache = None
         return self.link_count
     
     def get_link_count(self) -> int:
@@ -136,19 +181,31 @@ class Inode:
     
     def get_info(self) -> Dict:
         """获取inode信息"""
+        cache = self._info_cache
+        if cache is None:
+            cache = self._info_cache = self._build_info()
+        # 每次返回新字典；访问时间和直接块列表实时读取，
+        # 访问时间变化不需要让缓存失效
+        info = cache.copy()
+        info['accessed_time'] = self.accessed_time
+        info['direct_blocks'] = self.get_direct_blocks()
+        return info
+    
+    def _build_info(self) -> Dict:
+        """生成 get_info 中可缓存的部分，由修改这些字段的方法使缓存失效"""
         return {
             'inode_number': self.inode_number,
-            'file_type': self.file_type.value,
+            'file_type': FILE_TYPE_NAMES[self.file_type],
             'size': self.size,
             'blocks': self.blocks,
             'permissions': oct(self.permissions),
             'created_time': self.created_time,
             'modified_time': self.modified_time,
-            'accessed_time': self.accessed_time,
+            'accessed_time': None,  # 由 get_info 实时填入
             'owner_id': self.owner_id,
             'group_id': self.group_id,
             'link_count': self.link_count,
-            'direct_blocks': self.get_direct_blocks(),
+            'direct_blocks': None,  # 由 get_info 实时填入
             'single_indirect': self.single_indirect,
             'double_indirect': self.double_indirect,
             'triple_indirect': self.triple_indirect
@@ -180,27 +237,40 @@ class Inode:
 class InodeTable:
     """索引节点表"""
     
-    def __init__(self, max_inodes: int = 1024):
+    def __init__(self, max_inodes: int = 1024, max_pool_size: int = 64, chunk_size: int = 256):
         """初始化索引节点表"""
         self.max_inodes = max_inodes
         self.inodes: Dict[int, Inode] = {}
-        self.free_inodes: List[int] = list(range(1, max_inodes + 1))
-        self.next_inode_number = 1
+        # 已释放的inode对象池，分配时重置后复用，避免反复创建对象
+        self._inode_pool: List[Inode] = []
+        self.max_pool_size = max_pool_size
+        # 池为空时一次预分配的inode对象数
+        self.chunk_size = chunk_size
+        # inode位图：第 i 位对应 inode i+1，置1表示已分配
+        self.inode_bitmap = bytearray((max_inodes + 7) // 8)
+        # 位图中该位置之前的位全部已分配，搜索从这里开始
+        self.next_free_hint = 0
         
         self.logger = Logger()
         self.logger.info(f"索引节点表初始化: 最大 {max_inodes} 个inode")
     
     def allocate_inode(self, file_type: FileType = FileType.REGULAR) -> Optional[Inode]:
         """分配新的索引节点"""
-        if not self.free_inodes:
+        index = self._find_free_index()
+        if index < 0:
             self.logger.warning("没有可用的inode")
             return None
         
-        inode_number = self.free_inodes.pop(0)
-        inode = Inode(inode_number, file_type)
+        self.inode_bitmap[index >> 3] |= 1 << (index & 7)
+        self.next_free_hint = index + 1
+        inode_number = index + 1
+        if not self._inode_pool:
+            self._refill_pool()
+        inode = self._inode_pool.pop()
+        inode.reset(inode_number, file_type)
         self.inodes[inode_number] = inode
         
-        self.logger.log_file_event(f"分配inode: {inode_number}, 类型: {file_type.value}")
+        self.logger.log_file_event("分配inode: %s, 类型: %s", inode_number, FILE_TYPE_NAMES[file_type])
         return inode
     
     def free_inode(self, inode_number: int) -> bool:
@@ -214,19 +284,50 @@ class InodeTable:
             return False
         
         del self.inodes[inode_number]
-        self.free_inodes.append(inode_number)
-        self.free_inodes.sort()
+        index = inode_number - 1
+        self.inode_bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        if index < self.next_free_hint:
+            self.next_free_hint = index
+        # 释放后调用方不应再持有该inode，对象会被后续分配复用
+        if len(self._inode_pool) < self.max_pool_size:
+            self._inode_pool.append(inode)
         
-        self.logger.log_file_event(f"释放inode: {inode_number}")
+        self.logger.log_file_event("释放inode: %s", inode_number)
         return True
     
+    def _refill_pool(self):
+        """批量创建一组inode对象放入池中
+        
+        只调用 __new__ 跳过 __init__，对象在分配时由 reset 初始化。
+        """
+        count = min(self.chunk_size, self.max_inodes - len(self.inodes))
+        new = Inode.__new__
+        pool = self._inode_pool
+        for _ in range(count):
+            inode = new(Inode)
+            inode.fs_specific = {}
+            pool.append(inode)
+    
+    def _find_free_index(self) -> int:
+        """在位图中查找最小的空闲位，没有则返回 -1"""
+        bitmap = self.inode_bitmap
+        # 每次取8字节作为一个64位整数，一次检查64个inode
+        for offset in range((self.next_free_hint >> 6) << 3, len(bitmap), 8):
+            word = int.from_bytes(bitmap[offset:offset + 8], 'little')
+            free = ~word & 0xFFFFFFFFFFFFFFFF
+            if free:
+                index = (offset << 3) + (free & -free).bit_length() - 1
+                # 末尾不足一字节的填充位不对应任何inode
+                return index if index < self.max_inodes else -1
+        return -1
+    
     def get_inode(self, inode_number: int) -> Optional[Inode]:
         """获取索引节点"""
         return self.inodes.get(inode_number)
     
     def get_free_inode_count(self) -> int:
         """获取空闲inode数量"""
-        return len(self.free_inodes)
+        return self.max_inodes - len(self.inodes)
     
     def get_used_inode_count(self) -> int:
         """获取已使用inode数量"""
@@ -3,11 +3,16 @@
 """
 
 import threading
-from typing import Dict, List, Callable, Any
+import time
+from collections import deque
+from typing import Dict, List, Callable, Any, Deque, NamedTuple, Tuple
 from enum import Enum
 
 from utils.logger import Logger
 
+# 中断时间戳的取时函数，绑定为模块级名称减少属性查找
+_now = time.time
+
 class InterruptType(Enum):
     """中断类型枚举"""
     TIMER = "timer"
@@ -17,6 +22,12 @@ class InterruptType(Enum):
     DIVIDE_BY_ZERO = "divide_by_zero"
     INVALID_OPCODE = "invalid_opcode"
 
+class Interrupt(NamedTuple):
+    """中断记录"""
+    type: InterruptType
+    data: Any
+    timestamp: float
+
 class InterruptHandler:
     """中断处理器"""
     
@@ -24,9 +35,16 @@ class InterruptHandler:
         """初始化中断处理器"""
         self.logger = Logger()
         self.interrupt_handlers: Dict[InterruptType, List[Callable]] = {}
-        self.interrupt_queue = []
+        # interrupt_handlers 的不可变快照，注册时整体替换，分发时直接读取
+        self._handler_tuples: Dict[InterruptType, Tuple[Callable, ...]] = {}
+        self.interrupt_queue: Deque[Interrupt] = deque()
+        # 队列中各类型待处理中断的数量，入队/出队时增减
+        self._pending_counts: Dict[InterruptType, int] = {t: 0 for t in InterruptType}
         self.interrupt_enabled = True
+        # lock 串行化中断处理与处理程序注册；_queue_lock 只保护队列和计数，
+        # 持有时间很短，触发中断的一方不会等待正在运行的处理程序
         self.lock = threading.Lock()
+        self._queue_lock = threading.Lock()
         
         # 初始化中断处理程序
         self._init_default_handlers()
@@ -35,6 +53,7 @@ class InterruptHandler:
         """初始化默认中断处理程序"""
         for interrupt_type in InterruptType:
             self.interrupt_handlers[interrupt_type] = []
+            self._handler_tuples[interrupt_type] = ()
     
     def register_handler(self, interrupt_type: InterruptType, handler: Callable):
         """注册中断处理程序"""
@@ -42,39 +61,44 @@ class InterruptHandler:
             if interrupt_type not in self.interrupt_handlers:
                 self.interrupt_handlers[interrupt_type] = []
             self.interrupt_handlers[interrupt_type].append(handler)
+            self._handler_tuples[interrupt_type] = tuple(self.interrupt_handlers[interrupt_type])
             self.logger.info(f"注册中断处理程序: {interrupt_type.value}")
     
     def raise_interrupt(self, interrupt_type: InterruptType, data: Any = None):
         """触发中断"""
-        with self.lock:
-            interrupt = {
-                'type': interrupt_type,
-                'data': data,
-                'timestamp': time.time()
-            }
+        interrupt = Interrupt(interrupt_type, data, _now())
+        with self._queue_lock:
             self.interrupt_queue.append(interrupt)
-            self.logger.log_system_event(f"中断触发: {interrupt_type.value}")
+            self._pending_counts[interrupt_type] += 1
+        self.logger.log_system_event(f"中断触发: {interrupt_type.value}")
     
     def handle_interrupts(self):
         """处理中断队列"""
         with self.lock:
-            while self.interrupt_queue and self.interrupt_enabled:
-                interrupt = self.interrupt_queue.pop(0)
+            queue = self.interrupt_queue
+            while self.interrupt_enabled:
+                with self._queue_lock:
+                    if not queue:
+                        break
+                    interrupt = queue.popleft()
+                    self._pending_counts[interrupt.type] -= 1
+                # 处理程序在队列锁之外运行，其中可以再次触发中断
                 self._process_interrupt(interrupt)
     
-    def _process_interrupt(self, interrupt: Dict):
+    def _process_interrupt(self, interrupt: Interrupt):
         """处理单个中断"""
-        interrupt_type = interrupt['type']
-        data = interrupt['data']
+        interrupt_type, data, _ = interrupt
         
-        if interrupt_type in self.interrupt_handlers:
-            for handler in self.interrupt_handlers[interrupt_type]:
-                try:
-                    handler(data)
-                except Exception as e:
-                    self.logger.error(f"中断处理程序错误: {e}")
-        else:
+        handlers = self._handler_tuples.get(interrupt_type)
+        if handlers is None:
             self.logger.warning(f"未找到中断处理程序: {interrupt_type.value}")
+            return
+        
+        for handler in handlers:
+            try:
+                handler(data)
+            except Exception as e:
+                self.logger.error(f"中断处理程序错误: {e}")
     
     def enable_interrupts(self):
         """启用中断"""
@@ -88,13 +112,7 @@ class InterruptHandler:
     
     def get_interrupt_stats(self) -> Dict[str, int]:
         """获取中断统计信息"""
-        stats = {}
-        for interrupt_type in InterruptType:
-            stats[interrupt_type.value] = len([
-                i for i in self.interrupt_queue 
-                if i['type'] == interrupt_type
-            ])
-        return stats
+        return {interrupt_type.value: count for interrupt_type, count in self._pending_counts.items()}
 
 # 默认中断处理程序示例
 def default_timer_handler(data):
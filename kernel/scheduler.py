@@ -2,10 +2,12 @@
 进程调度器 - 负责进程的调度和执行
 """
 
+import heapq
+import itertools
 import threading
 import time
 import queue
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 from process.process import Process
@@ -25,15 +27,25 @@ class Scheduler:
         """初始化调度器"""
         self.logger = Logger()
         self.running = False
-        self.ready_queue = queue.Queue()
+        # 就绪队列：按 (优先级, 入队序号) 排序的最小堆，优先级数值小的先调度，
+        # 同优先级按入队顺序轮转
+        self.ready_queue: List[Tuple[int, int, Process]] = []
+        self._ready_seq = itertools.count()
+        # 每个就绪进程当前有效条目的入队序号（PID -> 序号）。序号对不上的堆条目
+        # 都已失效（进程被移除或重新入队），出队时跳过（延迟删除）；就绪队列大小以此为准
+        self._ready_pids: Dict[int, int] = {}
+        # 就绪队列为空时调度线程在此等待，加入进程或停止调度时唤醒
+        self._ready_cv = threading.Condition()
         self.waiting_queue = queue.Queue()
         self.current_process: Optional[Process] = None
-        self.processes: List[Process] = []
+        # 调度器中的进程，按PID索引（保持加入顺序）
+        self.processes: Dict[int, Process] = {}
         self.scheduler_thread: Optional[threading.Thread] = None
         self.time_quantum = 1.0  # 时间片（秒）
         self.cpu_usage = 0.0
-        self.total_cpu_time = 0.0
-        self.idle_time = 0.0
+        # CPU时间和空闲时间以单调时钟的整数纳秒累计，避免浮点误差随运行时间累积
+        self.total_cpu_time_ns = 0
+        self.idle_time_ns = 0
         
     def start(self):
         """启动调度器"""
@@ -46,36 +58,59 @@ class Scheduler:
     def stop(self):
         """停止调度器"""
         self.running = False
+        with self._ready_cv:
+            self._ready_cv.notify_all()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=2)
         self.logger.info("进程调度器停止")
     
     def add_process(self, process: Process):
         """添加进程到调度队列"""
-        self.processes.append(process)
-        self.ready_queue.put(process)
+        with self._ready_cv:
+            self.processes[process.pid] = process
+            self._push_ready(process)
+            self._ready_cv.notify()
         self.logger.log_process_event(process.pid, "added to scheduler")
     
     def remove_process(self, pid: int):
         """从调度器中移除进程"""
-        for i, process in enumerate(self.processes):
-            if process.pid == pid:
-                self.processes.pop(i)
-                self.logger.log_process_event(pid, "removed from scheduler")
-                break
+        with self._ready_cv:
+            removed = self.processes.pop(pid, None) is not None
+            self._ready_pids.pop(pid, None)
+        if removed:
+            self.logger.log_process_event(pid, "removed from scheduler")
+    
+    def _push_ready(self, process: Process):
+        """将进程放入就绪队列（调用方需持有 _ready_cv）"""
+        seq = next(self._ready_seq)
+        heapq.heappush(self.ready_queue, (process.priority, seq, process))
+        self._ready_pids[process.pid] = seq
+    
+    def _pop_ready(self) -> Optional[Process]:
+        """取出优先级最高的未移除进程（调用方需持有 _ready_cv）"""
+        ready_pids = self._ready_pids
+        while self.ready_queue:
+            _, seq, process = heapq.heappop(self.ready_queue)
+            if ready_pids.get(process.pid) == seq:
+                del ready_pids[process.pid]
+                return process
+        return None
     
     def _scheduler_loop(self):
         """调度器主循环"""
         while self.running:
             try:
-                if not self.ready_queue.empty():
+                with self._ready_cv:
+                    # 没有就绪进程，CPU空闲，阻塞等待而不是轮询
+                    while not self.ready_queue and self.running:
+                        idle_start = time.monotonic_ns()
+                        self._ready_cv.wait(timeout=1.0)
+                        self.idle_time_ns += time.monotonic_ns() - idle_start
                     # 获取下一个进程
-                    process = self.ready_queue.get()
+                    process = self._pop_ready()
+                
+                if process is not None:
                     self._execute_process(process)
-                else:
-                    # 没有就绪进程，CPU空闲
-                    time.sleep(0.1)
-                    self.idle_time += 0.1
                     
             except Exception as e:
                 self.logger.error(f"调度器错误: {e}")
@@ -86,21 +121,25 @@ class Scheduler:
         process.state = ProcessState.RUNNING
         self.logger.log_process_event(process.pid, "started execution")
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # 模拟进程执行
             process.execute(self.time_quantum)
             
             # 更新CPU使用率
-            execution_time = time.time() - start_time
-            self.total_cpu_time += execution_time
+            self.total_cpu_time_ns += time.monotonic_ns() - start_ns
             
             # 如果进程还未完成，重新加入就绪队列
             if process.state != ProcessState.TERMINATED:
                 process.state = ProcessState.READY
-                self.ready_queue.put(process)
-                self.logger.log_process_event(process.pid, "returned to ready queue")
+                with self._ready_cv:
+                    # 运行期间被移除的进程不再放回就绪队列
+                    requeue = self.processes.get(process.pid) is process
+                    if requeue:
+                        self._push_ready(process)
+                if requeue:
+                    self.logger.log_process_event(process.pid, "returned to ready queue")
             else:
                 self.logger.log_process_event(process.pid, "completed")
                 
@@ -112,9 +151,9 @@ class Scheduler:
     
     def get_cpu_usage(self) -> float:
         """获取CPU使用率"""
-        total_time = self.total_cpu_time + self.idle_time
+        total_time = self.total_cpu_time_ns + self.idle_time_ns
         if total_time > 0:
-            return (self.total_cpu_time / total_time) * 100
+            return (self.total_cpu_time_ns / total_time) * 100
         return 0.0
     
     def get_process_count(self) -> int:
@@ -127,7 +166,7 @@ class Scheduler:
     
     def get_ready_queue_size(self) -> int:
         """获取就绪队列大小"""
-        return self.ready_queue.qsize()
+        return len(self._ready_pids)
     
     def get_waiting_queue_size(self) -> int:
         """获取等待队列大小"""
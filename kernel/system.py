@@ -4,7 +4,7 @@
 
 import time
 import threading
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .scheduler import Scheduler
 from .memory_manager import MemoryManager
@@ -22,7 +22,7 @@ class System:
         """初始化系统"""
         self.logger = Logger()
         self.running = False
-        self.start_time = None
+        self.start_time_ns: Optional[int] = None  # 单调时钟，只用于计算运行时间
         
         # 初始化系统组件
         self.scheduler = Scheduler()
@@ -47,7 +47,7 @@ class System:
     def boot(self):
         """系统启动"""
         self.logger.info("系统启动中...")
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         self.running = True
         
         # 初始化各个子系统
@@ -113,8 +113,8 @@ class System:
     
     def _update_system_info(self):
         """更新系统信息"""
-        if self.start_time:
-            self.system_info['uptime'] = time.time() - self.start_time
+        if self.start_time_ns is not None:
+            self.system_info['uptime'] = (time.monotonic_ns() - self.start_time_ns) / 1e9
         
         self.system_info['process_count'] = self.process_manager.get_process_count()
         self.system_info['memory_usage'] = self.memory_manager.get_memory_usage()
@@ -39,6 +39,8 @@ class MemoryAllocator:
         
         # 内存块链表
         self.head = MemoryBlock(0, total_memory, True)
+        # 已分配块的起始地址索引，释放时直接定位，不遍历链表
+        self.allocated_blocks: Dict[int, MemoryBlock] = {}
         
         # 分配统计
         self.allocation_count = 0
@@ -52,54 +54,60 @@ class MemoryAllocator:
     
     def allocate(self, size: int, process_id: int = None) -> Optional[int]:
         """分配内存"""
+        if size <= 0:
+            self.logger.warning(f"无效的分配大小: {size}")
+            return None
+        
+        # 锁内只做查找和分配，日志在释放锁之后记录
         with self.lock:
-            if size <= 0:
-                self.logger.warning(f"无效的分配大小: {size}")
-                return None
-            
-            if size > self.free_memory:
-                self.logger.warning(f"内存不足，请求: {size}, 可用: {self.free_memory}")
-                return None
-            
-            # 根据策略查找合适的块
-            block = self._find_suitable_block(size)
-            if not block:
-                self.logger.warning(f"无法找到合适的内存块，大小: {size}")
-                return None
+            free_memory = self.free_memory
+            if size > free_memory:
+                block = None
+            else:
+                # 根据策略查找合适的块
+                block = self._find_suitable_block(size)
             
             # 分配内存
-            address = self._allocate_block(block, size, process_id)
-            if address is not None:
+            if block:
+                address = self._allocate_block(block, size, process_id)
                 self.allocation_count += 1
                 self.allocated_memory += size
                 self.free_memory -= size
-                self.logger.log_memory_event(f"分配内存: 地址 {address}, 大小 {size}, 进程 {process_id}")
-            
-            return address
+        
+        if size > free_memory:
+            self.logger.warning(f"内存不足，请求: {size}, 可用: {free_memory}")
+            return None
+        if not block:
+            self.logger.warning(f"无法找到合适的内存块，大小: {size}")
+            return None
+        
+        self.logger.log_memory_event(f"分配内存: 地址 {address}, 大小 {size}, 进程 {process_id}")
+        return address
     
     def deallocate(self, address: int) -> bool:
         """释放内存"""
         with self.lock:
-            block = self._find_block_by_address(address)
-            if not block or block.is_free:
-                self.logger.warning(f"无效的释放地址: {address}")
-                return False
-            
-            # 释放内存
-            size = block.size
-            block.is_free = True
-            block.allocated_time = None
-            block.process_id = None
-            
-            # 合并相邻的空闲块
-            self._merge_free_blocks()
-            
-            self.deallocation_count += 1
-            self.allocated_memory -= size
-            self.free_memory += size
-            
-            self.logger.log_memory_event(f"释放内存: 地址 {address}, 大小 {size}")
-            return True
+            block = self.allocated_blocks.pop(address, None)
+            if block is not None:
+                # 释放内存
+                size = block.size
+                block.is_free = True
+                block.allocated_time = None
+                block.process_id = None
+                
+                # 合并相邻的空闲块
+                self._merge_with_neighbors(block)
+                
+                self.deallocation_count += 1
+                self.allocated_memory -= size
+                self.free_memory += size
+        
+        if block is None:
+            self.logger.warning(f"无效的释放地址: {address}")
+            return False
+        
+        self.logger.log_memory_event(f"释放内存: 地址 {address}, 大小 {size}")
+        return True
     
     def _find_suitable_block(self, size: int) -> Optional[MemoryBlock]:
         """根据策略查找合适的内存块"""
@@ -174,30 +182,29 @@ class MemoryAllocator:
             block.next_block = new_block
             new_block.prev_block = block
         
+        self.allocated_blocks[address] = block
         return address
     
-    def _find_block_by_address(self, address: int) -> Optional[MemoryBlock]:
-        """根据地址查找内存块"""
-        current = self.head
-        while current:
-            if current.start_address == address:
-                return current
-            current = current.next_block
-        return None
-    
-    def _merge_free_blocks(self):
-        """合并相邻的空闲块"""
-        current = self.head
-        while current and current.next_block:
-            if current.is_free and current.next_block.is_free:
-                # 合并当前块和下一个块
-                current.size += current.next_block.size
-                current.next_block = current.next_block.next_block
-                if current.next_block:
-                    current.next_block.prev_block = current
-                self.fragmentation_count += 1
-            else:
-                current = current.next_block
+    def _merge_with_neighbors(self, block: MemoryBlock):
+        """将刚释放的块与前后相邻的空闲块合并
+        
+        其余位置不存在相邻的空闲块，只需检查它的前后两个块。
+        """
+        next_block = block.next_block
+        if next_block and next_block.is_free:
+            block.size += next_block.size
+            block.next_block = next_block.next_block
+            if block.next_block:
+                block.next_block.prev_block = block
+            self.fragmentation_count += 1
+        
+        prev_block = block.prev_block
+        if prev_block and prev_block.is_free:
+            prev_block.size += block.size
+            prev_block.next_block = block.next_block
+            if block.next_block:
+                block.next_block.prev_block = prev_block
+            self.fragmentation_count += 1
     
     def get_memory_stats(self) -> Dict[str, int]:
         """获取内存统计信息"""
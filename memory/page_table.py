@@ -28,6 +28,10 @@ class PageTable:
         """初始化页表"""
         self.process_id = process_id
         self.entries: Dict[int, PageTableEntry] = {}
+        # 存在/已访问/已修改的页表项数，随页表项的变化增量维护
+        self.present_count = 0
+        self.accessed_count = 0
+        self.modified_count = 0
         self.logger = Logger()
         self.lock = threading.Lock()
     
@@ -35,7 +39,11 @@ class PageTable:
         """添加页表项"""
         with self.lock:
             entry = PageTableEntry(virtual_page, physical_frame)
+            old_entry = self.entries.get(virtual_page)
+            if old_entry is not None:
+                self._uncount(old_entry)
             self.entries[virtual_page] = entry
+            self.present_count += entry.present
             self.logger.log_memory_event(f"添加页表项: 进程 {self.process_id}, 虚拟页 {virtual_page}")
             return entry
     
@@ -50,6 +58,8 @@ class PageTable:
             if virtual_page in self.entries:
                 entry = self.entries[virtual_page]
                 entry.physical_frame = physical_frame
+                self.present_count += not entry.present
+                self.accessed_count += not entry.accessed
                 entry.present = True
                 entry.accessed = True
                 self.logger.log_memory_event(f"更新页表项: 进程 {self.process_id}, 虚拟页 {virtual_page} -> 物理帧 {physical_frame}")
@@ -57,8 +67,9 @@ class PageTable:
     def remove_entry(self, virtual_page: int) -> bool:
         """移除页表项"""
         with self.lock:
-            if virtual_page in self.entries:
-                del self.entries[virtual_page]
+            entry = self.entries.pop(virtual_page, None)
+            if entry is not None:
+                self._uncount(entry)
                 self.logger.log_memory_event(f"移除页表项: 进程 {self.process_id}, 虚拟页 {virtual_page}")
                 return True
             return False
@@ -80,6 +91,7 @@ class PageTable:
         with self.lock:
             if virtual_page in self.entries:
                 entry = self.entries[virtual_page]
+                self.accessed_count += not entry.accessed
                 entry.accessed = True
                 entry.reference_count += 1
                 entry.access_time = time.time()
@@ -89,21 +101,23 @@ class PageTable:
         with self.lock:
             if virtual_page in self.entries:
                 entry = self.entries[virtual_page]
+                self.modified_count += not entry.modified
                 entry.modified = True
     
+    def _uncount(self, entry: PageTableEntry):
+        """从计数中减去即将移除的页表项（调用方需持有锁）"""
+        self.present_count -= entry.present
+        self.accessed_count -= entry.accessed
+        self.modified_count -= entry.modified
+    
     def get_stats(self) -> Dict[str, int]:
         """获取页表统计信息"""
         with self.lock:
-            total_entries = len(self.entries)
-            present_entries = sum(1 for entry in self.entries.values() if entry.present)
-            accessed_entries = sum(1 for entry in self.entries.values() if entry.accessed)
-            modified_entries = sum(1 for entry in self.entries.values() if entry.modified)
-            
             return {
-                'total_entries': total_entries,
-                'present_entries': present_entries,
-                'accessed_entries': accessed_entries,
-                'modified_entries': modified_entries
+                'total_entries': len(self.entries),
+                'present_entries': self.present_count,
+                'accessed_entries': self.accessed_count,
+                'modified_entries': self.modified_count
             }
     
     def print_page_table(self):
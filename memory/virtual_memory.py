@@ -18,8 +18,12 @@ class Page:
     """内存页面"""
     
     def __init__(self, page_number: int, size: int = 4096):
-        self.page_number = page_number
         self.size = size
+        self.reset(page_number)
+    
+    def reset(self, page_number: int):
+        """将页面重置为新建状态，供页面对象池复用"""
+        self.page_number = page_number
         self.state = PageState.FREE
         self.process_id = None
         self.frame_number = None
@@ -30,12 +34,18 @@ class Page:
 class VirtualMemory:
     """虚拟内存管理器"""
     
-    def __init__(self, physical_memory_size: int = 1024 * 1024, page_size: int = 4096):
+    def __init__(self, physical_memory_size: int = 1024 * 1024, page_size: int = 4096,
+                 max_pool_size: int = 256):
         """初始化虚拟内存管理器"""
         self.logger = Logger()
         self.physical_memory_size = physical_memory_size
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise ValueError(f"页面大小必须是2的幂: {page_size}")
         self.page_size = page_size
-        self.total_pages = physical_memory_size // page_size
+        # 页面大小是2的幂，页号和页内偏移用移位和掩码计算
+        self.page_shift = page_size.bit_length() - 1
+        self.page_mask = page_size - 1
+        self.total_pages = physical_memory_size >> self.page_shift
         
         # 物理内存帧
         self.physical_frames: List[Optional[Page]] = [None] * self.total_pages
@@ -43,8 +53,16 @@ class VirtualMemory:
         # 页面表 (进程ID -> 页面表)
         self.page_tables: Dict[int, Dict[int, Page]] = {}
         
-        # 空闲页面列表
-        self.free_pages: List[int] = list(range(self.total_pages))
+        # 物理帧位图：每帧一个字节，0表示空闲。用 bytearray.find 在C层查找空闲帧，
+        # 代替对空闲列表做 pop(0)
+        self.frame_bitmap = bytearray(self.total_pages)
+        self.free_frame_count = self.total_pages
+        # 该位置之前的帧全部已分配，查找从这里开始
+        self.next_free_frame = 0
+        
+        # 进程释放的页面对象池，进程频繁创建和退出时复用对象
+        self._page_pool: List[Page] = []
+        self.max_pool_size = max_pool_size
         
         # 页面置换算法
         self.page_replacement = None  # 将在后续实现
@@ -61,8 +79,8 @@ class VirtualMemory:
     def allocate_pages(self, process_id: int, num_pages: int) -> bool:
         """为进程分配虚拟页面"""
         with self.lock:
-            if num_pages > len(self.free_pages):
-                self.logger.warning(f"物理内存不足，请求: {num_pages}, 可用: {len(self.free_pages)}")
+            if num_pages > self.free_frame_count:
+                self.logger.warning(f"物理内存不足，请求: {num_pages}, 可用: {self.free_frame_count}")
                 return False
             
             # 创建进程页面表
@@ -71,13 +89,9 @@ class VirtualMemory:
             
             # 分配页面
             for i in range(num_pages):
-                if self.free_pages:
-                    frame_number = self.free_pages.pop(0)
-                    page = Page(len(self.page_tables[process_id]), self.page_size)
-                    page.state = PageState.ALLOCATED
-                    page.process_id = process_id
-                    page.frame_number = frame_number
-                    
+                frame_number = self._take_free_frame()
+                if frame_number >= 0:
+                    page = self._new_page(len(self.page_tables[process_id]), process_id, frame_number)
                     self.physical_frames[frame_number] = page
                     self.page_tables[process_id][page.page_number] = page
             
@@ -87,8 +101,8 @@ class VirtualMemory:
     def access_memory(self, process_id: int, virtual_address: int) -> bool:
         """访问虚拟内存地址"""
         with self.lock:
-            page_number = virtual_address // self.page_size
-            offset = virtual_address % self.page_size
+            page_number = virtual_address >> self.page_shift
+            offset = virtual_address & self.page_mask
             
             if process_id not in self.page_tables:
                 self.logger.error(f"进程 {process_id} 的页面表不存在")
@@ -115,13 +129,9 @@ class VirtualMemory:
         # 3. 将页面加载到物理内存
         
         # 临时实现：简单分配
-        if self.free_pages:
-            frame_number = self.free_pages.pop(0)
-            page = Page(page_number, self.page_size)
-            page.state = PageState.ALLOCATED
-            page.process_id = process_id
-            page.frame_number = frame_number
-            
+        frame_number = self._take_free_frame()
+        if frame_number >= 0:
+            page = self._new_page(page_number, process_id, frame_number)
             self.physical_frames[frame_number] = page
             self.page_tables[process_id][page_number] = page
             
@@ -137,22 +147,52 @@ class VirtualMemory:
             if process_id not in self.page_tables:
                 return False
             
-            for page in self.page_tables[process_id].values():
+            pool = self._page_pool
+            for page in self.page_tables.pop(process_id).values():
                 if page.frame_number is not None:
-                    self.physical_frames[page.frame_number] = None
-                    self.free_pages.append(page.frame_number)
+                    self._release_frame(page.frame_number)
+                if len(pool) < self.max_pool_size:
+                    pool.append(page)
             
-            del self.page_tables[process_id]
             self.logger.log_memory_event(f"释放进程 {process_id} 的所有页面")
             return True
     
+    def _new_page(self, page_number: int, process_id: int, frame_number: int) -> Page:
+        """取一个已分配状态的页面，优先复用池中的对象（调用方需持有锁）"""
+        if self._page_pool:
+            page = self._page_pool.pop()
+            page.reset(page_number)
+        else:
+            page = Page(page_number, self.page_size)
+        page.state = PageState.ALLOCATED
+        page.process_id = process_id
+        page.frame_number = frame_number
+        return page
+    
+    def _take_free_frame(self) -> int:
+        """占用编号最小的空闲物理帧，没有则返回 -1（调用方需持有锁）"""
+        frame_number = self.frame_bitmap.find(0, self.next_free_frame)
+        if frame_number >= 0:
+            self.frame_bitmap[frame_number] = 1
+            self.free_frame_count -= 1
+            self.next_free_frame = frame_number + 1
+        return frame_number
+    
+    def _release_frame(self, frame_number: int):
+        """释放物理帧（调用方需持有锁）"""
+        self.physical_frames[frame_number] = None
+        self.frame_bitmap[frame_number] = 0
+        self.free_frame_count += 1
+        if frame_number < self.next_free_frame:
+            self.next_free_frame = frame_number
+    
     def get_memory_stats(self) -> Dict[str, int]:
         """获取内存统计信息"""
         with self.lock:
             return {
                 'total_pages': self.total_pages,
-                'free_pages': len(self.free_pages),
-                'allocated_pages': self.total_pages - len(self.free_pages),
+                'free_pages': self.free_frame_count,
+                'allocated_pages': self.total_pages - self.free_frame_count,
                 'page_faults': self.page_faults,
                 'page_hits': self.page_hits,
                 'fault_rate': self.page_faults / (self.page_faults + self.page_hits) if (self.page_faults + self.page_hits) > 0 else 0
@@ -3,6 +3,7 @@
 """
 
 import time
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 class PCB:
@@ -41,6 +42,11 @@ class PCB:
             'working_directory': '/'
         }
         
+        # 上面几个信息字典的只读视图，get_info 直接返回，不再每次复制
+        self._scheduling_info_view = MappingProxyType(self.scheduling_info)
+        self._memory_info_view = MappingProxyType(self.memory_info)
+        self._file_info_view = MappingProxyType(self.file_info)
+        
         # 其他信息
         self.parent_pid = None
         self.child_pids = []
@@ -66,7 +72,10 @@ class PCB:
             self.child_pids.remove(child_pid)
     
     def get_info(self) -> Dict[str, Any]:
-        """获取PCB信息"""
+        """获取PCB信息
+        
+        scheduling_info/memory_info/file_info 是只读的实时视图，需要快照时自行 dict() 复制。
+        """
         return {
             'pid': self.pid,
             'name': self.name,
@@ -76,9 +85,9 @@ class PCB:
             'child_pids': self.child_pids.copy(),
             'creation_time': self.creation_time,
             'last_access_time': self.last_access_time,
-            'scheduling_info': self.scheduling_info.copy(),
-            'memory_info': self.memory_info.copy(),
-            'file_info': self.file_info.copy()
+            'scheduling_info': self._scheduling_info_view,
+            'memory_info': self._memory_info_view,
+            'file_info': self._file_info_view
         }
     
     def __str__(self) -> str:
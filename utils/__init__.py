@@ -4,8 +4,10 @@
 
 from .logger import Logger
 from .config import Config
+from .file_types import FileType
 
 __all__ = [
     'Logger',
-    'Config'
+    'Config',
+    'FileType'
 ] 
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+时钟工具 - 提供文件系统时间戳使用的取时函数
+"""
+
+import functools
+import time
+
+# 文件元数据时间戳只需要粗粒度的墙钟时间，平台支持时使用更便宜的粗粒度时钟
+if hasattr(time, 'CLOCK_REALTIME_COARSE'):
+    coarse_time = functools.partial(time.clock_gettime, time.CLOCK_REALTIME_COARSE)
+else:
+    coarse_time = time.time
@@ -0,0 +1,22 @@
+"""
+文件类型模块 - 文件系统各部分共用的文件类型定义
+"""
+
+from enum import IntEnum
+
+class FileType(IntEnum):
+    """文件类型枚举（整数值，比较是整数比较）"""
+    REGULAR = 1
+    DIRECTORY = 2
+    SYMBOLIC_LINK = 3
+    FIFO = 4
+    SOCKET = 5
+
+# 文件类型的显示名称
+FILE_TYPE_NAMES = {
+    FileType.REGULAR: "regular",
+    FileType.DIRECTORY: "directory",
+    FileType.SYMBOLIC_LINK: "symlink",
+    FileType.FIFO: "fifo",
+    FileType.SOCKET: "socket"
+}
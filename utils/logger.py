@@ -48,25 +48,25 @@ class Logger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """记录调试信息"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """记录一般信息"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """记录警告信息"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """记录错误信息"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """记录严重错误信息"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
     
     def log_system_event(self, event: str, details: Optional[str] = None):
         """记录系统事件"""
@@ -89,9 +89,18 @@ class Logger:
             message += f" - {details}"
         self.info(message)
     
-    def log_file_event(self, event: str, details: Optional[str] = None):
-        """记录文件系统事件"""
-        message = f"FILESYSTEM: {event}"
+    def log_file_event(self, event: str, *args, details: Optional[str] = None):
+        """记录文件系统事件
+        
+        文件系统的调用非常频繁，event 可以带 % 占位符，
+        参数只在INFO级别启用时才格式化。
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        message = "FILESYSTEM: " + event
         if details:
-            message += f" - {details}"
-        self.info(message) 
\ No newline at end of file
+            if args:
+                message %= args
+                args = ()
+            message += " - " + details
+        self.logger.info(message, *args)